@@ -41,24 +41,163 @@ Performance Improvement:
     - 3-4× faster with better quality!
 """
 
-from typing import Dict, List
-from app.services.llm_service import LLMService
+import asyncio
+import hashlib
+import json
+import logging
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from app.services.llm_service import LLMService, get_llm_service
 from app.models.response import ArticleContent, ArticleSection
+from app.utils.text import word_count as _word_count
+
+logger = logging.getLogger(__name__)
+
+# H2 headings ("## Heading") at the start of a line - compiled once at import
+_H2_RE = re.compile(r'^## (.+?)$', re.MULTILINE)
+
+# Start of an H2 heading line with at least one heading character after "## ".
+# Used to find where a streamed section ends (the next heading begins).
+_H2_START_RE = re.compile(r'^## (?=.)', re.MULTILINE)
+
+# One delimited section body in a batched fallback response
+_SECTION_BLOCK_RE = re.compile(r'\[\[BEGIN (\d+)\]\](.*?)\[\[END \1\]\]', re.DOTALL)
+
+# How much of the article opening is handed to on_head callbacks. The SEO
+# prompts send at most a 125-token (~500 char) excerpt, picked by keyword
+# density (utils.excerpt.select_excerpt); a head several times that size
+# gives the selector real choice while still arriving early in the stream
+ARTICLE_HEAD_CHARS = 2000
+
+# Finished one-shot articles kept in the in-process cache (LRU eviction)
+_ARTICLE_CACHE_SIZE = 64
+
+# Max section requests in flight when the fallback path writes sections concurrently
+_FALLBACK_MAX_CONCURRENCY = 4
+
+# Writing rules shared by every one-shot generation. Kept as a module constant so
+# the system prompt is byte-identical across calls. The system prompts built from
+# it (~350-375 tokens) are under Sonnet's 1024-token caching minimum, so the
+# cache_system breakpoints below do not produce cache hits yet.
+_STATIC_WRITING_RULES = """CRITICAL WRITING REQUIREMENTS:
+
+1. **Write the ENTIRE article at once** - maintain perfect narrative flow from intro to conclusion
+2. **Follow the outline structure exactly** - use the ## H2 and ### H3 headings as specified
+3. **Hit word count targets** - each section should be approximately its target length (±20 words acceptable)
+4. **Professional but conversational tone** - sound like a human expert, not a robot
+5. **CRITICAL: Hemingway-style sentences** - Maximum 15 words per sentence. Short. Punchy. Clear.
+6. **Short paragraphs** - 2-4 sentences each for readability
+7. **Specific examples and actionable tips** - avoid generic statements
+8. **Natural keyword usage** - incorporate keywords organically, not stuffed
+9. **Smooth transitions** - connect sections naturally without repetitive phrases like "As mentioned earlier"
+10. **Avoid AI clichés**: Never use:
+   - "In conclusion"
+   - "It's important to note"  
+   - "In today's digital age"
+   - "It goes without saying"
+   - "At the end of the day"
+11. **Human writing style**:
+    - Use contractions (you'll, we're, it's)
+    - Vary sentence length (mix short punchy sentences with longer explanatory ones)
+    - Be specific rather than vague
+    - Include occasional questions to engage readers
+    - Use active voice"""
+
+# System prompts, built once at import so every call sends identical bytes
+_ONESHOT_SYSTEM = (
+    "You are an expert content writer who creates engaging, SEO-optimized articles "
+    "that read naturally and provide real value. Write the ENTIRE article in one "
+    "response, maintaining perfect coherence and flow throughout.\n\n"
+    + _STATIC_WRITING_RULES
+)
+_SECTION_SYSTEM = (
+    "You are an expert content writer who creates engaging, SEO-optimized articles "
+    "that read naturally and provide real value to readers."
+)
+_BATCH_SYSTEM = f"{_SECTION_SYSTEM}\n\n{_STATIC_WRITING_RULES}"
+
+_ONESHOT_STATIC_TAIL = "\n\nWrite the FULL article now:"
+
+
+class _SectionSpec(NamedTuple):
+    """One outline section with defaults applied (normalized once per article)."""
+    h2: str
+    h3s: List[str]
+    word_count: int
+    key_points: List[str]
+
+
+def _normalize_sections(sections_data: List[Dict]) -> List[_SectionSpec]:
+    """Resolve each outline section dict into a _SectionSpec in a single pass."""
+    return [
+        _SectionSpec(
+            s.get("h2", ""),
+            s.get("h3s", []),
+            s.get("word_count", 300),
+            s.get("key_points", [])
+        )
+        for s in sections_data
+    ]
+
+
+def _max_tokens_for(total_words: int, delimiter_overhead: int = 0) -> int:
+    """Size the output budget to the requested length instead of a flat 8000.
+    
+    ~1.8 tokens per English word including markdown, plus 512 tokens of
+    headroom for the H1/headings, capped at 8192.
+    """
+    return min(8192, int(total_words * 1.8) + 512 + delimiter_overhead)
+
+
+@lru_cache(maxsize=128)
+def _oneshot_prompt_header(h1: str, total_words: int, primary_keyword: str, keywords_str: str) -> str:
+    """Format the per-article keyword/format block of the one-shot prompt.
+    
+    Pure function of its arguments, so retries and repeated topics reuse the
+    already-formatted string.
+    """
+    return f"""TOTAL TARGET: {total_words} words
+
+KEYWORDS TO INCORPORATE NATURALLY: {keywords_str}
+
+**CRITICAL KEYWORD REQUIREMENT**: The primary keyword "{primary_keyword}" MUST appear:
+   - At least ONCE in the introduction (first 100 words)
+   - 0.5-2.5% density across the full article (~{int(total_words * 0.01)} times total)
+   - Naturally integrated, not stuffed (use variations when appropriate)
+
+FORMAT: Write the complete article in markdown format, starting with the H1 title (# {h1}), then all sections with their H2 and H3 headings as specified in the outline."""
+
 
 class ContentGenerator:
     """Generates complete, SEO-optimized article content from structured outlines.
     
     This agent is the primary content creation engine, responsible for turning
     blueprint (outline) into publishable article.
+    
+    Finished articles are cached per (job, outline, serp_analysis) at class
+    level, since the orchestrator builds a fresh generator for every job.
+    Only a retry of the same job is served from the cache - two jobs that
+    share an outline (via the semantic pipeline cache) still get distinct
+    articles.
     """
     
-    def __init__(self):
-        self.llm_service = LLMService()
+    # Shared across instances: cache key -> generated article (LRU order)
+    _article_cache: "OrderedDict[str, ArticleContent]" = OrderedDict()
+    # Single-flight locks so identical concurrent requests make one LLM call
+    _inflight: Dict[str, asyncio.Lock] = {}
+    
+    def __init__(self, llm_service: Optional[LLMService] = None):
+        # Injected by the orchestrator so all agents share one service
+        self.llm_service = llm_service or get_llm_service()
     
     async def generate_article(
         self, 
         outline: Dict, 
-        serp_analysis: Dict
+        serp_analysis: Dict,
+        on_head: Optional[Callable[[str], None]] = None,
+        job_id: Optional[str] = None
     ) -> ArticleContent:
         """Generate complete article using One-Shot generation (entire article at once).
         
@@ -82,6 +221,15 @@ class ContentGenerator:
             serp_analysis: SERP insights from Step 2 containing:
                 - primary_keyword: Main keyword to incorporate
                 - secondary_keywords: Related terms to include
+            on_head: Optional callback invoked once, mid-stream, with the first
+                ARTICLE_HEAD_CHARS characters of the article, so callers can
+                start work that only needs the opening (e.g., SEO prompts).
+                Not called for cached or fallback articles, and the final
+                full_text may differ from the head (e.g., an H1 is prepended),
+                so callers should verify full_text.startswith(head).
+            job_id: Job the article belongs to. When given, the finished
+                article is cached for retries of that job; when None, nothing
+                is cached.
         
         Returns:
             ArticleContent object with:
@@ -94,53 +242,125 @@ class ContentGenerator:
             - Mock mode: ~5 seconds (instant LLM response)
             - Real mode: ~45-60 seconds (one API call)
             - 3-4× faster than loop-based approach!
+            - Retries of the same job with the same (outline, serp_analysis):
+              served from the in-process LRU cache with no API call
+        """
+        
+        if job_id is None:
+            return await self._generate_article_uncached(outline, serp_analysis, None, on_head)
+        
+        cache_key = self._cache_key(job_id, outline, serp_analysis)
+        cached = self._get_cached_article(cache_key)
+        if cached is not None:
+            return cached
+        
+        lock = self._inflight.setdefault(cache_key, asyncio.Lock())
+        try:
+            async with lock:
+                # An identical request may have finished while we waited
+                cached = self._get_cached_article(cache_key)
+                if cached is not None:
+                    return cached
+                return await self._generate_article_uncached(outline, serp_analysis, cache_key, on_head)
+        finally:
+            if self._inflight.get(cache_key) is lock and not lock.locked():
+                del self._inflight[cache_key]
+    
+    @staticmethod
+    def _cache_key(job_id: str, outline: Dict, serp_analysis: Dict) -> str:
+        """Hash the job and generation inputs into a compact cache key (blake2b, 128-bit)."""
+        payload = json.dumps(
+            {"job": job_id, "outline": outline, "serp": serp_analysis},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+    
+    def _get_cached_article(self, cache_key: str) -> Optional[ArticleContent]:
+        """Return a deep copy of a cached article (or None), refreshing its LRU position."""
+        cached = self._article_cache.get(cache_key)
+        if cached is None:
+            return None
+        self._article_cache.move_to_end(cache_key)
+        logger.info("♻️  Reusing cached article: '%s'", cached.h1)
+        # Deep copy so callers can't mutate the cached instance
+        return cached.model_copy(deep=True)
+    
+    def _store_cached_article(self, cache_key: str, article: ArticleContent) -> None:
+        """Insert an article into the LRU cache, evicting the oldest entry when full."""
+        self._article_cache[cache_key] = article.model_copy(deep=True)
+        self._article_cache.move_to_end(cache_key)
+        if len(self._article_cache) > _ARTICLE_CACHE_SIZE:
+            self._article_cache.popitem(last=False)
+    
+    async def _generate_article_uncached(
+        self,
+        outline: Dict,
+        serp_analysis: Dict,
+        cache_key: Optional[str],
+        on_head: Optional[Callable[[str], None]] = None
+    ) -> ArticleContent:
+        """Run one-shot generation (with fallback) and cache one-shot results.
+        
+        Fallback output is not cached, so a later request gets another chance
+        at a full one-shot article. A None cache_key disables caching.
         """
         
         h1 = outline.get("h1", "")
-        sections_data = outline.get("sections", [])
+        sections = _normalize_sections(outline.get("sections", []))
+        total_target = sum(spec.word_count for spec in sections)
         primary_keyword = serp_analysis.get("primary_keyword", "")
         secondary_keywords = serp_analysis.get("secondary_keywords", [])
         
-        print(f"🖊️  Generating article (One-Shot): '{h1}'")
-        print(f"   Target: {sum(s.get('word_count', 0) for s in sections_data)} words across {len(sections_data)} sections")
+        logger.info("🖊️  Generating article (One-Shot): '%s'", h1)
+        logger.info("   Target: %d words across %d sections", total_target, len(sections))
         
         try:
-            # Generate the ENTIRE article in one shot
-            full_article = await self._generate_full_article_oneshot(
+            # Generate the ENTIRE article in one shot (sections are parsed
+            # incrementally while the response streams in)
+            full_article, parsed_sections = await self._generate_full_article_oneshot(
                 h1=h1,
-                sections_data=sections_data,
+                sections=sections,
+                total_words=total_target,
                 primary_keyword=primary_keyword,
-                secondary_keywords=secondary_keywords
+                secondary_keywords=secondary_keywords,
+                on_head=on_head
             )
             
-            # Parse the generated markdown into structured sections
-            parsed_sections = self._parse_article_into_sections(full_article, sections_data)
+            # No H2 found while streaming - build the fallback structure
+            if not parsed_sections:
+                parsed_sections = self._parse_article_into_sections(full_article, sections)
             
             # Calculate total word count
-            total_words = len(full_article.split())
+            total_words = _word_count(full_article)
             
-            print(f"✅ Article generated: {total_words} words total")
+            logger.info("✅ Article generated: %d words total", total_words)
             
-            return ArticleContent(
+            article = ArticleContent(
                 h1=h1,
                 sections=parsed_sections,
                 full_text=full_article,
                 word_count=total_words
             )
+            if cache_key is not None:
+                self._store_cached_article(cache_key, article)
+            return article
             
         except Exception as e:
             # Graceful fallback: if one-shot fails, use section-by-section as backup
-            print(f"⚠️  Warning: One-shot generation failed: {e}")
-            print(f"   Falling back to section-by-section generation...")
-            return await self._generate_article_fallback(h1, sections_data, primary_keyword, secondary_keywords)
+            logger.warning("⚠️  Warning: One-shot generation failed: %s", e)
+            logger.warning("   Falling back to section-by-section generation...")
+            return await self._generate_article_fallback(h1, sections, primary_keyword, secondary_keywords)
     
     async def _generate_full_article_oneshot(
         self,
         h1: str,
-        sections_data: List[Dict],
+        sections: List[_SectionSpec],
         primary_keyword: str,
-        secondary_keywords: List[str]
-    ) -> str:
+        secondary_keywords: List[str],
+        total_words: int,
+        on_head: Optional[Callable[[str], None]] = None
+    ) -> Tuple[str, List[ArticleSection]]:
         """Generate the entire article in one shot using Claude Sonnet 4.5.
         
         This is the core One-Shot generation method that leverages Claude's
@@ -155,102 +375,97 @@ class ContentGenerator:
         
         Args:
             h1: Article title
-            sections_data: List of section definitions with h2, h3s, word_count, key_points
+            sections: Normalized section specs (h2, h3s, word_count, key_points)
             primary_keyword: Main keyword to target
             secondary_keywords: Related keywords to incorporate
+            total_words: Sum of the section word-count targets
+            on_head: Called once with the first ARTICLE_HEAD_CHARS characters
+                as soon as they have streamed in
+        
+        The response is streamed: each H2 section is parsed as soon as the
+        next heading arrives, so section parsing overlaps with generation
+        instead of waiting for the full response.
         
         Returns:
-            Complete article as markdown text
+            Tuple of (complete article as markdown text, parsed H2 sections)
         """
         
-        # Build the outline structure for the prompt
-        outline_structure = ""
-        for idx, section in enumerate(sections_data, 1):
-            h2 = section.get("h2", "")
-            h3s = section.get("h3s", [])
-            word_count = section.get("word_count", 300)
-            key_points = section.get("key_points", [])
-            
-            outline_structure += f"\n{idx}. ## {h2} (~{word_count} words)\n"
-            if h3s:
-                for h3 in h3s:
-                    outline_structure += f"   - ### {h3}\n"
-            if key_points:
-                outline_structure += f"   Key points: {', '.join(key_points)}\n"
+        # Build the outline structure for the prompt (collect parts, join once)
+        outline_parts = []
+        for idx, (h2, h3s, word_count, key_points) in enumerate(sections, 1):
+            h3_block = "".join(f"   - ### {h3}\n" for h3 in h3s)
+            kp_block = f"   Key points: {', '.join(key_points)}\n" if key_points else ""
+            outline_parts.append(f"\n{idx}. ## {h2} (~{word_count} words)\n{h3_block}{kp_block}")
+        outline_structure = "".join(outline_parts)
         
         keywords_str = ", ".join([primary_keyword] + secondary_keywords[:3])
-        total_words = sum(s.get("word_count", 300) for s in sections_data)
         
-        prompt = f"""Write a complete, SEO-optimized article following this exact structure:
-
-# {h1}
-
-ARTICLE OUTLINE:
-{outline_structure}
-
-TOTAL TARGET: {total_words} words
-
-KEYWORDS TO INCORPORATE NATURALLY: {keywords_str}
-
-**CRITICAL KEYWORD REQUIREMENT**: The primary keyword "{primary_keyword}" MUST appear:
-   - At least ONCE in the introduction (first 100 words)
-   - 0.5-2.5% density across the full article (~{int(total_words * 0.01)} times total)
-   - Naturally integrated, not stuffed (use variations when appropriate)
-
-CRITICAL WRITING REQUIREMENTS:
-
-1. **Write the ENTIRE article at once** - maintain perfect narrative flow from intro to conclusion
-2. **Follow the outline structure exactly** - use the ## H2 and ### H3 headings as specified
-3. **Hit word count targets** - each section should be approximately its target length (±20 words acceptable)
-4. **Professional but conversational tone** - sound like a human expert, not a robot
-5. **CRITICAL: Hemingway-style sentences** - Maximum 15 words per sentence. Short. Punchy. Clear.
-6. **Short paragraphs** - 2-4 sentences each for readability
-7. **Specific examples and actionable tips** - avoid generic statements
-8. **Natural keyword usage** - incorporate keywords organically, not stuffed
-9. **Smooth transitions** - connect sections naturally without repetitive phrases like "As mentioned earlier"
-10. **Avoid AI clichés**: Never use:
-   - "In conclusion"
-   - "It's important to note"  
-   - "In today's digital age"
-   - "It goes without saying"
-   - "At the end of the day"
-11. **Human writing style**:
-    - Use contractions (you'll, we're, it's)
-    - Vary sentence length (mix short punchy sentences with longer explanatory ones)
-    - Be specific rather than vague
-    - Include occasional questions to engage readers
-    - Use active voice
-
-FORMAT: Write the complete article in markdown format, starting with the H1 title (# {h1}), then all sections with their H2 and H3 headings as specified in the outline.
-
-Write the FULL article now:"""
+        # Static rules live in the (cached) system prompt; only the
+        # per-article outline and keyword targets are sent as fresh input
+        prompt = (
+            f"Write a complete, SEO-optimized article following this exact structure:\n\n"
+            f"# {h1}\n\nARTICLE OUTLINE:\n{outline_structure}\n\n"
+            + _oneshot_prompt_header(h1, total_words, primary_keyword, keywords_str)
+            + _ONESHOT_STATIC_TAIL
+        )
 
         try:
-            # Use generate_with_retry for robust error handling
-            # This automatically handles rate limits and transient failures
-            full_article = await self.llm_service.generate_with_retry(
+            # Stream with retry for robust error handling
+            # This automatically handles rate limits before the first chunk
+            chunks = []
+            parsed_sections = []
+            pending = ""  # Text of the section still being received
+            received = 0  # Characters streamed so far (for on_head)
+            
+            async for chunk in self.llm_service.generate_with_retry_stream(
                 prompt,
-                system_prompt="You are an expert content writer who creates engaging, SEO-optimized articles that read naturally and provide real value. Write the ENTIRE article in one response, maintaining perfect coherence and flow throughout.",
+                system_prompt=_ONESHOT_SYSTEM,
                 temperature=0.8,  # Higher temperature for creative, varied writing
                 max_retries=3,
-                max_tokens=8000  # Allow for longer articles (8000 tokens ≈ 6000 words)
-            )
+                max_tokens=_max_tokens_for(total_words),  # Right-sized to the word target
+                cache_system=True  # Identical across articles (cached once past 1024 tokens)
+            ):
+                chunks.append(chunk)
+                
+                # Hand the article opening to the caller as soon as it exists
+                if on_head is not None:
+                    received += len(chunk)
+                    if received >= ARTICLE_HEAD_CHARS:
+                        head = "".join(chunks).lstrip()[:ARTICLE_HEAD_CHARS]
+                        if len(head) == ARTICLE_HEAD_CHARS:
+                            on_head(head)
+                            on_head = None
+                
+                scan_from = max(1, len(pending) - 3)  # A heading may straddle chunks
+                pending += chunk
+                
+                # Everything before the last heading start is complete
+                last_start = None
+                for match in _H2_START_RE.finditer(pending, scan_from):
+                    last_start = match.start()
+                if last_start is not None:
+                    parsed_sections.extend(self._parse_article_into_sections(pending[:last_start], []))
+                    pending = pending[last_start:]
+            
+            parsed_sections.extend(self._parse_article_into_sections(pending, []))
+            full_article = "".join(chunks).strip()  # Strip once, reuse below
             
             # Validate the generated content
-            if not full_article or len(full_article.strip()) < 500:
+            if len(full_article) < 500:
                 raise ValueError(f"Generated article too short: {len(full_article)} chars")
             
-            # Ensure it starts with the H1
-            if not full_article.strip().startswith(f"# {h1}"):
-                full_article = f"# {h1}\n\n{full_article}"
+            # Ensure it starts with the H1 (startswith only inspects the prefix)
+            expected_prefix = f"# {h1}"
+            if not full_article.startswith(expected_prefix):
+                full_article = f"{expected_prefix}\n\n{full_article}"
             
-            return full_article.strip()
+            return full_article, parsed_sections
             
         except Exception as e:
-            print(f"❌ One-shot generation failed: {e}")
+            logger.error("❌ One-shot generation failed: %s", e)
             raise  # Re-raise to trigger fallback in main method
     
-    def _parse_article_into_sections(self, full_article: str, sections_data: List[Dict]) -> List[ArticleSection]:
+    def _parse_article_into_sections(self, full_article: str, sections: List[_SectionSpec]) -> List[ArticleSection]:
         """Parse the generated markdown article into structured ArticleSection objects.
         
         This method splits the one-shot generated article back into individual
@@ -258,7 +473,7 @@ Write the FULL article now:"""
         
         Args:
             full_article: Complete article markdown text
-            sections_data: Original section definitions (for extracting H2 headings)
+            sections: Original section specs (for extracting H2 headings)
         
         Returns:
             List of ArticleSection objects with heading, content, word_count
@@ -266,41 +481,28 @@ Write the FULL article now:"""
         
         parsed_sections = []
         
-        # Split by H2 headings (##)
-        # Pattern: ## followed by heading text
-        import re
+        # Split by H2 headings in a single pass over the text. Because the
+        # pattern has one capture group, re.split returns
+        # [preamble, heading1, body1, heading2, body2, ...]
+        parts = _H2_RE.split(full_article)
         
-        # Extract all H2 sections
-        h2_pattern = r'^## (.+?)$'
-        h2_matches = list(re.finditer(h2_pattern, full_article, re.MULTILINE))
-        
-        for idx, match in enumerate(h2_matches):
-            h2_heading = match.group(1).strip()
-            start_pos = match.end()
-            
-            # Find where this section ends (next H2 or end of article)
-            if idx + 1 < len(h2_matches):
-                end_pos = h2_matches[idx + 1].start()
-            else:
-                end_pos = len(full_article)
-            
-            # Extract content between this H2 and the next
-            section_content = full_article[start_pos:end_pos].strip()
+        for h2_heading, section_body in zip(parts[1::2], parts[2::2]):
+            section_content = section_body.strip()
             
             # Create ArticleSection object
             parsed_sections.append(ArticleSection(
-                heading=h2_heading,
+                heading=h2_heading.strip(),
                 heading_level=2,
                 content=section_content,
-                word_count=len(section_content.split())
+                word_count=_word_count(section_content)
             ))
         
         # If parsing failed (no H2 found), create fallback structure
-        if not parsed_sections and sections_data:
+        if not parsed_sections and sections:
             # Use original section structure as fallback
-            for section in sections_data:
+            for section in sections:
                 parsed_sections.append(ArticleSection(
-                    heading=section.get("h2", "Section"),
+                    heading=section.h2 or "Section",
                     heading_level=2,
                     content="Content parsing failed - article generated but structure unclear.",
                     word_count=0
@@ -311,7 +513,7 @@ Write the FULL article now:"""
     async def _generate_article_fallback(
         self,
         h1: str,
-        sections_data: List[Dict],
+        sections: List[_SectionSpec],
         primary_keyword: str,
         secondary_keywords: List[str]
     ) -> ArticleContent:
@@ -325,52 +527,75 @@ Write the FULL article now:"""
             - Works even if article is too long for one-shot
             - Handles edge cases where one-shot fails
         
+        All sections are first requested in ONE batched call (each body wrapped
+        in [[BEGIN n]]...[[END n]] delimiters), so the shared context is sent
+        once. Only sections missing from that response are re-requested
+        individually, concurrently (bounded by _FALLBACK_MAX_CONCURRENCY).
+        
         Drawbacks:
-            - Slower (3 minutes vs 60 seconds)
             - Repetitive transitions between sections
             - Less coherent narrative flow
         """
         
-        print("   Using fallback: section-by-section generation...")
+        logger.info("   Using fallback: section-by-section generation...")
+        
+        keywords = [primary_keyword] + secondary_keywords[:2]
+        
+        batched = await self._generate_sections_batch(h1, sections, keywords)
+        
+        # Sections missing from the batch are independent API calls, so fire
+        # them concurrently. The semaphore caps in-flight requests to stay
+        # under LLM rate limits.
+        semaphore = asyncio.Semaphore(_FALLBACK_MAX_CONCURRENCY)
+        
+        async def generate_bounded(idx: int, section: _SectionSpec) -> str:
+            if idx in batched:
+                return batched[idx]
+            async with semaphore:
+                logger.debug("   - Fallback section %d/%d: %s", idx, len(sections), section.h2)
+                return await self._generate_section_content(
+                    h1=h1,
+                    h2=section.h2,
+                    h3s=section.h3s,
+                    word_count=section.word_count,
+                    key_points=section.key_points,
+                    keywords=keywords
+                )
+        
+        contents = await asyncio.gather(
+            *(generate_bounded(idx, section) for idx, section in enumerate(sections, 1)),
+            return_exceptions=True
+        )
         
+        # Assemble in outline order (gather preserves input order)
         generated_sections = []
-        full_text = f"# {h1}\n\n"
+        full_text_parts = [f"# {h1}\n\n"]
         total_words = 0
         
-        for idx, section in enumerate(sections_data, 1):
-            h2 = section.get("h2", "")
-            h3s = section.get("h3s", [])
-            word_count_target = section.get("word_count", 300)
-            key_points = section.get("key_points", [])
-            
-            print(f"   - Fallback section {idx}/{len(sections_data)}: {h2}")
-            
-            # Generate content for this section
-            section_content = await self._generate_section_content(
-                h1=h1,
-                h2=h2,
-                h3s=h3s,
-                word_count=word_count_target,
-                key_points=key_points,
-                keywords=[primary_keyword] + secondary_keywords[:2]
-            )
+        for section, section_content in zip(sections, contents):
+            h2 = section.h2
+            if isinstance(section_content, BaseException):
+                logger.warning("⚠️  Warning: Content generation failed for '%s': %s", h2, section_content)
+                section_content = self._placeholder_section_content(
+                    h2, section.key_points, keywords
+                )
             
             # Create section object
             article_section = ArticleSection(
                 heading=h2,
                 heading_level=2,
                 content=section_content,
-                word_count=len(section_content.split())
+                word_count=_word_count(section_content)
             )
             
             generated_sections.append(article_section)
-            full_text += f"## {h2}\n\n{section_content}\n\n"
+            full_text_parts.append(f"## {h2}\n\n{section_content}\n\n")
             total_words += article_section.word_count
         
         return ArticleContent(
             h1=h1,
             sections=generated_sections,
-            full_text=full_text,
+            full_text="".join(full_text_parts),
             word_count=total_words
         )
     
@@ -431,11 +656,11 @@ Write the FULL article now:"""
         
         h3_context = ""
         if h3s:
-            h3_context = f"\n\nStructure the content with these H3 subheadings:\n" + "\n".join([f"- {h3}" for h3 in h3s])
+            h3_context = f"\n\nStructure the content with these H3 subheadings:\n" + "\n".join(f"- {h3}" for h3 in h3s)
         
         points_context = ""
         if key_points:
-            points_context = f"\n\nKey points to cover:\n" + "\n".join([f"- {point}" for point in key_points])
+            points_context = f"\n\nKey points to cover:\n" + "\n".join(f"- {point}" for point in key_points)
         
         keywords_str = ", ".join(keywords[:3])
         
@@ -468,9 +693,10 @@ Write the section content now (do not repeat the H2 heading, start with the cont
             # This automatically handles rate limits and transient failures
             content = await self.llm_service.generate_with_retry(
                 prompt,
-                system_prompt="You are an expert content writer who creates engaging, SEO-optimized articles that read naturally and provide real value to readers.",
+                system_prompt=_SECTION_SYSTEM,
                 temperature=0.8,  # Higher temperature for more creative, varied writing
-                max_retries=3
+                max_retries=3,
+                cache_system=True  # Same system prompt for every section
             )
             
             # Validate the content isn't empty or suspiciously short
@@ -483,11 +709,99 @@ Write the section content now (do not repeat the H2 heading, start with the cont
         except Exception as e:
             # Graceful degradation: return placeholder content
             # This ensures the pipeline completes even if one section fails
-            print(f"⚠️  Warning: Content generation failed for '{h2}': {e}")
-            print(f"   Using fallback placeholder content...")
+            logger.warning("⚠️  Warning: Content generation failed for '%s': %s", h2, e)
+            logger.warning("   Using fallback placeholder content...")
             
-            # Fallback content is functional but clearly marked
-            return f"""This section would cover {h2.lower()}. In a production environment, this content would be generated using the LLM service.
+            return self._placeholder_section_content(h2, key_points, keywords)
+    
+    async def _generate_sections_batch(
+        self,
+        h1: str,
+        sections: List[_SectionSpec],
+        keywords: List[str]
+    ) -> Dict[int, str]:
+        """Generate every fallback section in a single LLM call.
+        
+        Each section spec is enumerated in one prompt and the model is asked
+        to wrap each body in [[BEGIN n]]...[[END n]] delimiters. This sends the
+        shared context (title, keywords, writing rules) once instead of once
+        per section.
+        
+        Args:
+            h1: Article title (for context)
+            sections: Normalized section specs (h2, h3s, word_count, key_points)
+            keywords: Primary + top 2 secondary keywords
+        
+        Returns:
+            Dict mapping 1-based section number to its content. Sections that
+            were missing, empty, or far too short are omitted so the caller
+            can re-request just those.
+        """
+        
+        spec_parts = []
+        for idx, (h2, h3s, word_count, key_points) in enumerate(sections, 1):
+            spec_parts.append(
+                f'<<<SECTION id={idx} h2="{h2}" words={word_count} '
+                f'h3s={h3s} points={key_points}>>>\n'
+            )
+        
+        prompt = f"""Write every section listed below for an SEO-optimized article.
+
+Article Title: {h1}
+KEYWORDS TO INCLUDE NATURALLY: {", ".join(keywords[:3])}
+
+SECTIONS:
+{"".join(spec_parts)}
+For each section, write ONLY its body (do not repeat the H2 heading; use "### H3 Title" for any listed H3s) and wrap it exactly like this:
+[[BEGIN 1]]
+...section 1 content...
+[[END 1]]
+
+Hit each section's word target (±20 words). Include the primary keyword "{keywords[0] if keywords else ''}" 2-3 times per section.
+
+Write all {len(sections)} sections now:"""
+
+        try:
+            response = await self.llm_service.generate_with_retry(
+                prompt,
+                system_prompt=_BATCH_SYSTEM,
+                temperature=0.8,
+                max_retries=3,
+                # ~16 tokens per section for the [[BEGIN n]]/[[END n]] markers
+                max_tokens=_max_tokens_for(
+                    sum(spec.word_count for spec in sections),
+                    delimiter_overhead=16 * len(sections)
+                ),
+                cache_system=True
+            )
+        except Exception as e:
+            logger.warning("⚠️  Warning: Batched section generation failed: %s", e)
+            return {}
+        
+        batched = {}
+        for match in _SECTION_BLOCK_RE.finditer(response or ""):
+            idx = int(match.group(1))
+            content = match.group(2).strip()
+            if not 1 <= idx <= len(sections):
+                continue
+            # Per-section sanity check: re-request sections that came back empty
+            # or under a quarter of their target length
+            target = sections[idx - 1].word_count
+            if len(content) < 50 or _word_count(content) < target // 4:
+                continue
+            batched[idx] = content
+        
+        logger.info("   Batched generation returned %d/%d sections", len(batched), len(sections))
+        return batched
+    
+    @staticmethod
+    def _placeholder_section_content(h2: str, key_points: List[str], keywords: List[str]) -> str:
+        """Build placeholder text for a section whose generation failed.
+        
+        Fallback content is functional but clearly marked, so the pipeline
+        completes even if one section cannot be written.
+        """
+        return f"""This section would cover {h2.lower()}. In a production environment, this content would be generated using the LLM service.
 
 Key topics to explore include {', '.join(key_points[:2]) if key_points else 'relevant information'}.
 
@@ -17,9 +17,12 @@ The 10-Step Pipeline:
 
 Checkpoint System:
     - After Step 1: Save serp_data (enables debugging SERP analysis)
+    - After Step 2: Save analysis_data (needed to resume at Step 4)
     - After Step 3: Save outline_data (enables debugging content generation)
     - If generation crashes, we have checkpoints for debugging
-    - Currently not implementing resume-from-checkpoint, but data structure supports it
+    - Checkpoints are staged in memory and committed every few seconds by a
+      background task (and with the final result), not one commit each
+    - Re-running a job resumes from its checkpoints (same PIPELINE_VERSION only)
 
 Error Handling:
     - Any step failure triggers catch block
@@ -37,12 +40,30 @@ from app.agents.outline_generator import OutlineGenerator
 from app.agents.content_generator import ContentGenerator
 from app.agents.seo_metadata_generator import SEOMetadataGenerator
 from app.agents.quality_validator import QualityValidator
-from app.services.serp_service import SerpAPIService
+from app.services.serp_service import get_serp_service
+from app.services.llm_service import get_llm_service
+from app.services.semantic_cache import get_semantic_cache
 from app.models.request import ArticleGenerationRequest
-from app.models.response import ArticleOutput
+from app.models.response import ArticleOutput, SERPResult
 from app.database.models import ArticleJob, JobStatusEnum, SessionLocal
-from datetime import datetime
-import json
+from sqlalchemy import update
+from sqlalchemy.exc import OperationalError
+from dataclasses import asdict
+from datetime import datetime, timezone
+import asyncio
+import logging
+import threading
+import time
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Identifies the prompts/data shapes that produced a job's checkpoints.
+# Bump whenever Steps 1-3 change so stale checkpoints aren't resumed.
+PIPELINE_VERSION = "2025.1"
+
+# Seconds between opportunistic commits of staged checkpoints
+_CHECKPOINT_FLUSH_INTERVAL = 5.0
 
 class ArticleGenerationOrchestrator:
     """Orchestrates all agents to execute the 10-step article generation pipeline.
@@ -52,11 +73,13 @@ class ArticleGenerationOrchestrator:
     tied to a specific job_id for database tracking.
     """
     
-    def __init__(self, job_id: str):
+    def __init__(self, job_id: str, resume: bool = True):
         """Initialize orchestrator with all required agents and services.
         
         Args:
             job_id: UUID string identifying this specific generation job
+            resume: Reuse checkpoints saved by an earlier run of this job
+                    (same PIPELINE_VERSION only) instead of redoing Steps 1-3
         
         Initializes:
             - SERP Service: Fetches Google search results (Step 1)
@@ -66,18 +89,36 @@ class ArticleGenerationOrchestrator:
             - SEO Generator: Creates metadata, links, references (Steps 5-7)
             - Quality Validator: Checks SEO compliance (Step 9)
         
-        All agents share the same LLM service instance (either real or mock).
+        All agents share the same LLM service instance (either real or mock),
+        which in turn uses the process-wide Claude client.
         """
         self.job_id = job_id
+        self.resume = resume
         
-        # Service layer
-        self.serp_service = SerpAPIService()
+        # Staged (uncommitted) column updates and the task that flushes them
+        self._pending = {}
+        self._flush_task = None
+        
+        # Single DB session for all status/checkpoint writes (plus the job row,
+        # loaded only when resuming from checkpoints).
+        # _db_lock serializes session access: all DB work runs in worker
+        # threads. _pending_lock only guards the staged dict, so staging a
+        # checkpoint on the event loop never waits on a commit in progress.
+        self._db = None
+        self._job = None
+        self._db_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        
+        # Service layer (the HTTP clients behind these are process-wide)
+        self.serp_service = get_serp_service()
+        self.llm_service = get_llm_service()
+        self.semantic_cache = get_semantic_cache()  # Shared across jobs
         
         # Agent layer (5 specialized agents)
-        self.serp_analyzer = SERPAnalyzer()
-        self.outline_generator = OutlineGenerator()
-        self.content_generator = ContentGenerator()
-        self.seo_generator = SEOMetadataGenerator()
+        self.serp_analyzer = SERPAnalyzer(self.llm_service)
+        self.outline_generator = OutlineGenerator(self.llm_service)
+        self.content_generator = ContentGenerator(self.llm_service)
+        self.seo_generator = SEOMetadataGenerator(self.llm_service)
         self.quality_validator = QualityValidator()
     
     async def generate(self, request: ArticleGenerationRequest) -> ArticleOutput:
@@ -122,95 +163,161 @@ class ArticleGenerationOrchestrator:
             - At least 3 H2 headings
         """
         
-        print(f"\n{'='*60}")
-        print(f"🚀 Starting Article Generation")
-        print(f"Job ID: {self.job_id}")
-        print(f"Topic: {request.topic}")
-        print(f"Target: {request.target_word_count} words")
-        print(f"{'='*60}\n")
+        logger.info(
+            "\n%s\n🚀 Starting Article Generation\nJob ID: %s\nTopic: %s\nTarget: %d words\n%s\n",
+            "=" * 60, self.job_id, request.topic, request.target_word_count, "=" * 60
+        )
+        
+        # SERP results as plain dicts, shared by the checkpoint and the result
+        serp_dump = None
+        
+        # Steps 5-7 started early from the streamed article opening (Step 4)
+        early_seo = None
+        early_head = None
         
         try:
-            # Update database: pending → running
-            # This lets API clients see the job is actively processing
-            self._update_status(JobStatusEnum.RUNNING)
-            
-            # ===== STEP 1: Fetch SERP Results =====
-            # Get top 10 Google results for the topic
-            # In mock mode: Returns pre-defined realistic results
-            # In real mode: Calls SerpAPI (costs 1 credit per search)
-            print(f"📍 Step 1/10: Fetching SERP results...")
-            serp_results = self.serp_service.search(request.topic)
-            
-            # Save checkpoint: SERP data for debugging
-            self._save_checkpoint("serp_data", [
-                {"rank": r.rank, "url": r.url, "title": r.title, "snippet": r.snippet}
-                for r in serp_results
-            ])
-            
-            # ===== STEP 2: Analyze SERP =====
-            # Extract: common topics, subtopics, content gaps, keywords
-            # This tells us what's already ranking and what we can add
-            print(f"\n📍 Step 2/10: Analyzing SERP data...")
-            serp_analysis = await self.serp_analyzer.analyze_serp_results(
-                serp_results, request.topic
+            # ===== RESUME: Load checkpoints from an earlier run of this job =====
+            # Only checkpoints written by the same PIPELINE_VERSION are reused.
+            # Read before the RUNNING update below, which stamps the current version.
+            serp_results, serp_analysis, outline = (
+                await asyncio.to_thread(self._load_checkpoints) if self.resume
+                else (None, None, None)
             )
             
-            # ===== STEP 3: Generate Outline =====
-            # Create H1, H2s, H3s based on SERP analysis
-            # Distributes word count across sections
-            print(f"\n📍 Step 3/10: Generating article outline...")
-            outline = await self.outline_generator.generate_outline(
-                serp_analysis, request.topic, request.target_word_count
-            )
+            # Update database: pending → running
+            # This lets API clients see the job is actively processing. The row
+            # is stamped with the current PIPELINE_VERSION, so checkpoints this
+            # run doesn't reuse are cleared in the same commit - otherwise stale
+            # ones would later pass as current-version checkpoints.
+            run_fields = {"pipeline_version": PIPELINE_VERSION}
+            if serp_results is None:
+                run_fields["serp_data"] = None
+            if outline is None:
+                run_fields.update(analysis_data=None, outline_data=None)
+            await self._update_status(JobStatusEnum.RUNNING, **run_fields)
+            self._flush_task = asyncio.create_task(self._periodic_flush())
             
-            # Save checkpoint: Outline for debugging content generation
-            self._save_checkpoint("outline_data", outline)
+            if outline is not None:
+                self._log_step("1-3", "Resuming from saved checkpoints")
+            else:
+                # ===== STEPS 1-3 (cached): SERP + Analysis + Outline =====
+                # Near-duplicate topics (same words, different order/case/plurals)
+                # with the same word-count target and language reuse an earlier
+                # job's Steps 1-3 - the outline's section budget depends on both
+                cache_bucket = (request.target_word_count, request.language)
+                cached_steps = None
+                if serp_results is None:
+                    cached_steps = self.semantic_cache.lookup(
+                        "pipeline", request.topic, cache_bucket
+                    )
+                
+                if cached_steps is not None:
+                    serp_results, serp_analysis, outline = cached_steps
+                    self._log_step("1-3", "Reusing SERP data, analysis and outline from a similar topic")
+                    serp_dump = [asdict(r) for r in serp_results]
+                    self._save_checkpoint("serp_data", serp_dump)
+                    self._save_checkpoint("analysis_data", serp_analysis)
+                    self._save_checkpoint("outline_data", outline)
+                else:
+                    # ===== STEP 1: Fetch SERP Results =====
+                    # Get top 10 Google results for the topic
+                    # In mock mode: Returns pre-defined realistic results
+                    # In real mode: Calls SerpAPI (costs 1 credit per search)
+                    if serp_results is not None:
+                        self._log_step("1", "Resuming from saved SERP checkpoint")
+                    else:
+                        self._log_step("1", "Fetching SERP results...")
+                        serp_results = await self.serp_service.search(request.topic)
+                        
+                        # Save checkpoint: SERP data for debugging
+                        # Staged in memory; committed by the periodic flush
+                        # Dumped once and reused for the final result
+                        serp_dump = [asdict(r) for r in serp_results]
+                        self._save_checkpoint("serp_data", serp_dump)
+                    
+                    # ===== STEP 2: Analyze SERP =====
+                    # Extract: common topics, subtopics, content gaps, keywords
+                    # This tells us what's already ranking and what we can add
+                    self._log_step("2", "Analyzing SERP data...")
+                    serp_analysis = await self.serp_analyzer.analyze_serp_results(
+                        serp_results, request.topic
+                    )
+                    
+                    # Save checkpoint: analysis is needed to resume at Step 4
+                    self._save_checkpoint("analysis_data", serp_analysis)
+                    
+                    # ===== STEP 3: Generate Outline =====
+                    # Create H1, H2s, H3s based on SERP analysis
+                    # Distributes word count across sections
+                    self._log_step("3", "Generating article outline...")
+                    outline = await self.outline_generator.generate_outline(
+                        serp_analysis, request.topic, request.target_word_count
+                    )
+                    
+                    # Save checkpoint: Outline for debugging content generation
+                    # Staged in memory; committed by the periodic flush
+                    self._save_checkpoint("outline_data", outline)
+                    
+                    self.semantic_cache.store(
+                        "pipeline", request.topic, cache_bucket,
+                        (serp_results, serp_analysis, outline)
+                    )
             
             # ===== STEP 4: Generate Article Content =====
             # Write intro, sections, conclusion following outline
             # This is the longest step (~60% of total time)
-            print(f"\n📍 Step 4/10: Generating article content...")
-            article_content = await self.content_generator.generate_article(
-                outline, serp_analysis
-            )
+            # Steps 5-7 only read excerpts of the article's opening
+            # (ARTICLE_HEAD_CHARS), so they start as soon as that has streamed
+            # in, overlapping the rest of Step 4
+            self._log_step("4", "Generating article content...")
+            primary_keyword = serp_analysis.get("primary_keyword", request.topic)
             
-            # ===== STEP 5: Generate SEO Metadata =====
-            # Create title tag (50-60 chars), meta description (150-160), slug
-            print(f"\n📍 Step 5/10: Generating SEO metadata...")
-            seo_metadata = await self.seo_generator.generate_seo_metadata(
-                article_content.full_text,
-                article_content.h1,
-                serp_analysis.get("primary_keyword", request.topic)
-            )
+            def start_seo_steps(head: str):
+                nonlocal early_head, early_seo
+                self._log_step("5-7", "Starting SEO steps from the streamed article opening...")
+                early_head = head
+                early_seo = asyncio.create_task(self._run_seo_steps(
+                    head, outline.get("h1", ""), primary_keyword, request.topic
+                ))
             
-            # ===== STEP 6: Generate Internal Links =====
-            # Suggest 4-5 internal links with anchor text and context
-            print(f"\n📍 Step 6/10: Generating internal link suggestions...")
-            internal_links = await self.seo_generator.generate_internal_links(
-                article_content.full_text, request.topic
+            article_content = await self.content_generator.generate_article(
+                outline, serp_analysis, on_head=start_seo_steps, job_id=self.job_id
             )
             
-            # ===== STEP 7: Generate External References =====
-            # Find 3-5 authoritative external sources for E-E-A-T
-            print(f"\n📍 Step 7/10: Generating external reference suggestions...")
-            external_refs = await self.seo_generator.generate_external_references(
-                article_content.full_text, request.topic
-            )
+            # ===== STEPS 5-7: SEO Metadata, Internal Links, External References =====
+            # Reuse the early results if the final article still opens with the
+            # text they were built from; otherwise (fallback path, cached
+            # article, H1 prepended) run them on the final text
+            if early_seo is not None and article_content.h1 == outline.get("h1", "") \
+                    and article_content.full_text.startswith(early_head):
+                seo_metadata, internal_links, external_refs = await early_seo
+            else:
+                if early_seo is not None:
+                    self._discard_task(early_seo)
+                self._log_step("5-7", "Generating SEO metadata, internal links, and external references...")
+                seo_metadata, internal_links, external_refs = await self._run_seo_steps(
+                    article_content.full_text, article_content.h1, primary_keyword, request.topic
+                )
             
             # ===== STEP 8: Analyze Keywords =====
             # Calculate keyword density and distribution
             # Target: 1-2.5% density for primary keyword
-            print(f"\n📍 Step 8/10: Analyzing keyword usage...")
-            keyword_analysis = self.seo_generator.analyze_keywords(
+            self._log_step("8", "Analyzing keyword usage...")
+            # CPU-bound regex work runs in a worker thread so the event loop
+            # keeps serving other requests (e.g. GET /job polling)
+            keyword_analysis = await asyncio.to_thread(
+                self.seo_generator.analyze_keywords,
                 article_content.full_text,
                 serp_analysis.get("primary_keyword", request.topic),
-                serp_analysis.get("secondary_keywords", [])
+                serp_analysis.get("secondary_keywords", []),
+                article_content.word_count  # Already counted - skip a second full scan
             )
             
             # ===== STEP 9: Validate Quality =====
             # Check: word count, title length, description length, keyword density
-            print(f"\n📍 Step 9/10: Validating quality...")
-            quality_report = self.quality_validator.validate_seo_quality(
+            self._log_step("9", "Validating quality...")
+            quality_report = await asyncio.to_thread(
+                self.quality_validator.validate_seo_quality,
                 article_content,
                 seo_metadata,
                 request.target_word_count
@@ -218,8 +325,10 @@ class ArticleGenerationOrchestrator:
             
             # ===== STEP 10: Package Output =====
             # Combine all components into final ArticleOutput
-            print(f"\n📍 Step 10/10: Packaging results...")
-            result = ArticleOutput(
+            # Every part is already a validated model from its agent, so skip
+            # re-validating the whole nested tree
+            self._log_step("10", "Packaging results...")
+            result = ArticleOutput.model_construct(
                 article=article_content,
                 seo_metadata=seo_metadata,
                 keyword_analysis=keyword_analysis,
@@ -230,15 +339,18 @@ class ArticleGenerationOrchestrator:
             
             # Save to database with status=COMPLETED
             # User can now retrieve the result via GET /job/{job_id}
-            self._save_result(result)
+            # (staged checkpoints are committed in the same transaction)
+            await self._stop_periodic_flush()
+            await self._save_result(result, serp_dump)
             
             # Success message with quality metrics
-            print(f"\n{'='*60}")
-            print(f"✅ Article Generation Completed Successfully!")
-            print(f"   Quality Score: {quality_report['percentage']}%")
-            print(f"   Word Count: {article_content.word_count}")
-            print(f"   Status: {'PASSED' if quality_report['passed'] else 'NEEDS REVIEW'}")
-            print(f"{'='*60}\n")
+            logger.info(
+                "\n%s\n✅ Article Generation Completed Successfully!\n"
+                "   Quality Score: %s%%\n   Word Count: %d\n   Status: %s\n%s\n",
+                "=" * 60, quality_report['percentage'], article_content.word_count,
+                'PASSED' if quality_report['passed'] else 'NEEDS REVIEW', "=" * 60,
+                extra={"job_id": self.job_id}
+            )
             
             return result
             
@@ -246,40 +358,261 @@ class ArticleGenerationOrchestrator:
             # Catch any failure from the 10-step pipeline
             # Save error to database so user can see what went wrong
             error_msg = f"Generation failed: {str(e)}"
-            print(f"\n❌ ERROR: {error_msg}\n")
+            logger.error("\n❌ ERROR: %s\n", error_msg, extra={"job_id": self.job_id})
             
             # Persist error to database with status=FAILED
-            self._save_error(error_msg)
+            await self._stop_periodic_flush()
+            await self._save_error(error_msg)
             
             # Re-raise so background task logs it
             raise
+        
+        finally:
+            if early_seo is not None:
+                self._discard_task(early_seo)
+            
+            # Release this job's DB session, even if stopping the flush
+            # task re-raises the job's own cancellation
+            try:
+                await self._stop_periodic_flush()
+            finally:
+                self.close()
     
-    def _update_status(self, status: JobStatusEnum):
+    def _log_step(self, step: str, message: str):
+        """Log pipeline progress with the job ID and step attached as record fields.
+
+        Args:
+            step: Step number or range (e.g., "4" or "5-7")
+            message: Human-readable progress message
+        """
+        step_label = "Steps" if "-" in step else "Step"
+        logger.info(
+            "\n📍 %s %s/10: %s", step_label, step, message,
+            extra={"job_id": self.job_id, "step": step}
+        )
+
+    async def _run_seo_steps(self, article_text: str, h1: str, primary_keyword: str, topic: str):
+        """Run Steps 5-7 concurrently.
+        
+        All three depend only on the article (its opening, in practice) and
+        the SERP analysis, not on each other, so their LLM calls run
+        concurrently (SEOMetadataGenerator.generate_all); a failed call falls
+        back for its own part only.
+          5. Title tag (50-60 chars), meta description (150-160), slug
+          6. 4-5 internal links with anchor text and context
+          7. 3-5 authoritative external sources for E-E-A-T
+        
+        Args:
+            article_text: Article text (the full text or its streamed opening)
+            h1: Article title
+            primary_keyword: Main keyword from SERP analysis
+            topic: User's topic
+        
+        Returns:
+            Tuple of (SEOMetadata, internal links, external references)
+        """
+        return await self.seo_generator.generate_all(article_text, h1, topic, primary_keyword)
+    
+    @staticmethod
+    def _discard_task(task: asyncio.Task):
+        """Cancel a no-longer-needed task, consuming any exception it already raised."""
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled():
+            task.exception()  # Mark retrieved so asyncio doesn't warn
+    
+    def _session(self):
+        """Return the orchestrator's DB session, opening it on first use.
+        
+        One session is held for the whole pipeline. Callers must hold
+        self._db_lock.
+        """
+        if self._db is None:
+            self._db = SessionLocal()
+        return self._db
+    
+    def _job_row(self):
+        """Return this job's ORM row, loading it once per orchestrator.
+        
+        Only used for reads (resuming from checkpoints); writes go through
+        _commit_pending as targeted UPDATEs and never load the row.
+        Callers must hold self._db_lock.
+        
+        Returns:
+            ArticleJob instance, or None if the job doesn't exist
+        """
+        if self._job is None:
+            self._job = self._session().get(ArticleJob, self.job_id)
+        return self._job
+    
+    def close(self):
+        """Close the orchestrator's DB session (safe to call more than once)."""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+                self._job = None
+    
+    def _stage(self, fields: dict):
+        """Stage column updates for the job row without committing them.
+        
+        Staged values are kept in memory (not flushed), so no SQLite write
+        lock is held between commits. They are written by the next commit:
+        an immediate one (RUNNING, terminal result/error) or the periodic
+        background flush. Only takes _pending_lock, so it is safe to call
+        from the event loop.
+        
+        Args:
+            fields: Column name → value to set on the job row
+        """
+        with self._pending_lock:
+            self._pending.update(fields)
+    
+    async def _commit(self, fields: dict):
+        """Stage column updates and commit everything staged, off the event loop.
+        
+        The commit (which may wait on SQLite's busy_timeout and retry) runs
+        in a worker thread, so other jobs and API requests keep being served.
+        
+        Args:
+            fields: Column name → value to set on the job row
+        """
+        self._stage(fields)
+        await asyncio.to_thread(self._commit_locked)
+    
+    def _commit_locked(self):
+        """Commit staged updates while holding the session lock (worker thread)."""
+        with self._db_lock:
+            self._commit_pending()
+    
+    def _commit_pending(self):
+        """Apply staged updates to the job row and commit in one transaction.
+        
+        Issues a single UPDATE ... WHERE id = job_id for exactly the staged
+        columns: the row is never loaded, and large JSON columns that
+        didn't change (e.g. outline_data on a status update) aren't
+        rewritten. Updating a missing job is a no-op.
+        
+        Values staged while the commit is in flight stay pending for the
+        next one. A transient OperationalError (e.g. "database is locked")
+        is retried once after rolling back. Callers must hold self._db_lock
+        and run it off the event loop.
+        """
+        with self._pending_lock:
+            staged = dict(self._pending)
+        if not staged:
+            return
+        for attempt in range(2):
+            try:
+                db = self._session()
+                db.execute(
+                    update(ArticleJob)
+                    .where(ArticleJob.id == self.job_id)
+                    .values(**staged)
+                )
+                db.commit()
+                with self._pending_lock:
+                    for field, value in staged.items():
+                        if self._pending.get(field) is value:
+                            del self._pending[field]
+                return
+            except OperationalError as e:
+                self._db.rollback()
+                if attempt:
+                    raise
+                logger.warning("⚠️  Commit failed (%s), retrying once...", e)
+                time.sleep(0.1)
+    
+    def _flush_pending(self):
+        """Commit staged checkpoints, if any (runs in a worker thread)."""
+        with self._db_lock:
+            with self._pending_lock:
+                fields = ", ".join(self._pending)
+            if not fields:
+                return
+            try:
+                self._commit_pending()
+                logger.info("   💾 Checkpoint flushed: %s", fields)
+            except Exception as e:
+                self._db.rollback()
+                logger.warning("⚠️  Failed to flush checkpoints: %s", e)
+    
+    async def _periodic_flush(self):
+        """Opportunistically commit staged checkpoints every few seconds.
+        
+        Runs as a background task for the lifetime of generate(), so
+        checkpoints become durable during long LLM steps without a commit
+        per checkpoint.
+        """
+        while True:
+            await asyncio.sleep(_CHECKPOINT_FLUSH_INTERVAL)
+            await asyncio.to_thread(self._flush_pending)
+    
+    async def _stop_periodic_flush(self):
+        """Cancel the background flush task and wait for it to finish.
+        
+        Only the flush task's own cancellation is swallowed: if the job
+        itself is being cancelled (e.g. the event loop shutting down its
+        worker) while waiting here, the CancelledError is re-raised.
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                if asyncio.current_task().cancelling():
+                    raise
+            finally:
+                self._flush_task = None
+    
+    def _load_checkpoints(self):
+        """Load saved checkpoints so a re-run job can skip finished steps.
+        
+        Checkpoints are only trusted when the job row's pipeline_version
+        matches PIPELINE_VERSION - prompts or data shapes may have changed
+        since they were written.
+        
+        Returns:
+            Tuple of (serp_results, serp_analysis, outline), each None when
+            unavailable. outline (and serp_analysis) are only returned
+            together, since Step 4 needs both.
+        """
+        with self._db_lock:
+            try:
+                job = self._job_row()
+            except Exception as e:
+                logger.warning("⚠️  Failed to load checkpoints: %s", e)
+                return None, None, None
+            if job is None or job.pipeline_version != PIPELINE_VERSION or not job.serp_data:
+                return None, None, None
+            
+            serp_results = [SERPResult(**r) for r in job.serp_data]
+            if job.analysis_data and job.outline_data:
+                return serp_results, job.analysis_data, job.outline_data
+            return serp_results, None, None
+    
+    async def _update_status(self, status: JobStatusEnum, **fields):
         """Update job status in database.
         
         Called when status changes: PENDING → RUNNING → COMPLETED/FAILED
         
         Args:
             status: New status to set
+            **fields: Extra columns to write in the same commit
+                      (e.g., pipeline_version when the job starts)
         
         Side Effects:
             - Updates job.status in database
-            - Commits transaction immediately
+            - Commits transaction immediately (with any staged checkpoints)
             - Logs warning if update fails (non-fatal)
         """
-        db = SessionLocal()
         try:
-            job = db.query(ArticleJob).filter(ArticleJob.id == self.job_id).first()
-            if job:
-                job.status = status
-                db.commit()
+            await self._commit({"status": status, **fields})
         except Exception as e:
-            print(f"⚠️  Failed to update status: {e}")
-        finally:
-            db.close()
+            logger.warning("⚠️  Failed to update status: %s", e)
     
     def _save_checkpoint(self, field: str, data):
-        """Save checkpoint data for debugging and potential resumability.
+        """Stage checkpoint data for debugging and potential resumability.
         
         Checkpoints saved:
             - serp_data (after Step 1): List of SERP results
@@ -295,53 +628,47 @@ class ArticleGenerationOrchestrator:
             data: JSON-serializable data to save
         
         Side Effects:
-            - Updates specified field in database
-            - Logs checkpoint save confirmation
-            - Non-fatal if save fails
+            - Stages the field in memory; it is committed by the periodic
+              flush or together with the final result/error
+            - Logs checkpoint confirmation
         """
-        db = SessionLocal()
-        try:
-            job = db.query(ArticleJob).filter(ArticleJob.id == self.job_id).first()
-            if job:
-                setattr(job, field, data)  # Dynamically set field
-                db.commit()
-                print(f"   💾 Checkpoint saved: {field}")
-        except Exception as e:
-            print(f"⚠️  Failed to save checkpoint: {e}")
-        finally:
-            db.close()
+        self._stage({field: data})
+        logger.debug("   💾 Checkpoint staged: %s", field)
     
-    def _save_result(self, result: ArticleOutput):
+    async def _save_result(self, result: ArticleOutput, serp_dump: Optional[List[dict]] = None):
         """Save final successful result to database.
         
         Args:
             result: Complete ArticleOutput with all components
+            serp_dump: SERP results already dumped for the serp_data
+                checkpoint; reused instead of serializing them again
         
         Side Effects:
             - Converts Pydantic model to JSON and stores in job.result
             - Sets job.status = COMPLETED
             - Sets job.completed_at = current UTC time
-            - Commits transaction
+            - Commits transaction (including any staged checkpoints)
         
         After this:
             - User can retrieve result via GET /job/{job_id}
             - API will return status="completed" with full article
         """
-        db = SessionLocal()
         try:
-            job = db.query(ArticleJob).filter(ArticleJob.id == self.job_id).first()
-            if job:
-                # Convert Pydantic model to JSON for storage
-                job.result = json.loads(result.model_dump_json())
-                job.status = JobStatusEnum.COMPLETED
-                job.completed_at = datetime.utcnow()
-                db.commit()
+            # Convert Pydantic model to JSON-compatible dict in one pass
+            if serp_dump is None:
+                result_data = result.model_dump(mode="json")
+            else:
+                result_data = result.model_dump(mode="json", exclude={"serp_analysis"})
+                result_data["serp_analysis"] = serp_dump
+            await self._commit({
+                "result": result_data,
+                "status": JobStatusEnum.COMPLETED,
+                "completed_at": datetime.now(timezone.utc)
+            })
         except Exception as e:
-            print(f"⚠️  Failed to save result: {e}")
-        finally:
-            db.close()
+            logger.error("⚠️  Failed to save result: %s", e)
     
-    def _save_error(self, error: str):
+    async def _save_error(self, error: str):
         """Save error message when generation fails.
         
         Args:
@@ -351,22 +678,18 @@ class ArticleGenerationOrchestrator:
             - Sets job.error = error message
             - Sets job.status = FAILED
             - Sets job.completed_at = current UTC time
-            - Commits transaction
+            - Commits transaction (including any staged checkpoints)
         
         After this:
             - User sees error via GET /job/{job_id}
             - API returns status="failed" with error field populated
             - Can analyze what went wrong from error message
         """
-        db = SessionLocal()
         try:
-            job = db.query(ArticleJob).filter(ArticleJob.id == self.job_id).first()
-            if job:
-                job.error = error
-                job.status = JobStatusEnum.FAILED
-                job.completed_at = datetime.utcnow()
-                db.commit()
+            await self._commit({
+                "error": error,
+                "status": JobStatusEnum.FAILED,
+                "completed_at": datetime.now(timezone.utc)
+            })
         except Exception as e:
-            print(f"⚠️  Failed to save error: {e}")
-        finally:
-            db.close()
+            logger.error("⚠️  Failed to save error: %s", e)
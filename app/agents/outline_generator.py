@@ -25,8 +25,77 @@ SERP-Driven Planning:
     - Content gaps (unique angles for differentiation)
 """
 
-from typing import Dict
-from app.services.llm_service import LLMService
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from app.services.llm_service import LLMService, get_llm_service
+from app.utils.cache import TTLCache
+import copy
+import hashlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Outlines keep for a day: the inputs (SERP analysis) are themselves cached
+_OUTLINE_CACHE_TTL = 24 * 3600
+
+# System prompt emphasizes SEO expertise and content strategy
+_OUTLINE_SYSTEM = "You are an expert content strategist who creates SEO-optimized article structures."
+
+@dataclass(frozen=True, slots=True)
+class _FallbackSection:
+    """One section of the fallback outline template.
+    
+    h2 may contain {topic_title} and key_points may contain {topic}; they
+    are filled in by render(). Immutable and slotted, so the template is
+    built once at import and shared by every fallback.
+    """
+    h2: str
+    h3s: Tuple[str, ...]
+    word_count: int
+    key_points: Tuple[str, ...]
+    
+    def render(self, topic: str, topic_title: str) -> Dict:
+        """Return this section as an outline section dict for the given topic."""
+        return {
+            "h2": self.h2.format(topic_title=topic_title),
+            "h3s": list(self.h3s),
+            "word_count": self.word_count,
+            "key_points": [point.format(topic=topic) for point in self.key_points]
+        }
+
+# Generic outline used when the LLM call fails
+_FALLBACK_SECTIONS: Tuple[_FallbackSection, ...] = (
+    _FallbackSection(
+        h2="Introduction",
+        h3s=(),
+        word_count=200,
+        key_points=("Define {topic}", "Explain importance", "Overview of article")
+    ),
+    _FallbackSection(
+        h2="Understanding {topic_title}",
+        h3s=("Key Concepts", "Common Terminology"),
+        word_count=300,
+        key_points=("Explain fundamentals", "Provide context", "Share examples")
+    ),
+    _FallbackSection(
+        h2="Benefits of {topic_title}",
+        h3s=(),
+        word_count=250,
+        key_points=("List main benefits", "Provide evidence", "Share statistics")
+    ),
+    _FallbackSection(
+        h2="Best Practices for {topic_title}",
+        h3s=("Getting Started", "Advanced Tips"),
+        word_count=400,
+        key_points=("Step-by-step guidance", "Expert recommendations", "Common pitfalls")
+    ),
+    _FallbackSection(
+        h2="Conclusion",
+        h3s=(),
+        word_count=150,
+        key_points=("Summarize key takeaways", "Encourage action", "Future outlook")
+    ),
+)
 
 class OutlineGenerator:
     """Generates SEO-optimized article outlines based on SERP analysis.
@@ -35,8 +104,13 @@ class OutlineGenerator:
     competitive intelligence into actionable content structure.
     """
     
-    def __init__(self):
-        self.llm_service = LLMService()
+    # LLM-generated outlines keyed by a fingerprint of the prompt inputs,
+    # shared by every instance (one OutlineGenerator is built per job)
+    _outline_cache = TTLCache(maxsize=256, ttl=_OUTLINE_CACHE_TTL)
+    
+    def __init__(self, llm_service: Optional[LLMService] = None):
+        # Injected by the orchestrator so all agents share one service
+        self.llm_service = llm_service or get_llm_service()
     
     async def generate_outline(
         self, 
@@ -79,6 +153,10 @@ class OutlineGenerator:
         Raises:
             Exception: If LLM generation fails (fallback outline returned)
         
+        Caching:
+            Successful outlines are cached in-process for 24 hours, keyed by
+            a hash of the prompt; hits return a copy without an LLM call.
+        
         Outline Requirements:
             - 5-7 total sections (intro, 3-5 main, conclusion)
             - H1: 55-65 characters with primary keyword
@@ -127,12 +205,20 @@ REQUIREMENTS:
 
 Return ONLY the JSON object."""
 
+        # The prompt contains every input (topic, target, SERP insights), so
+        # its hash fingerprints the request; identical requests skip the LLM
+        cache_key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+        cached = self._outline_cache.get(cache_key)
+        if cached is not None:
+            logger.info("♻️  Reusing cached outline: %s...", cached.get('h1', 'N/A')[:60])
+            return copy.deepcopy(cached)
+
         try:
             # Call LLM to generate structured outline as JSON
-            # System prompt emphasizes SEO expertise and content strategy
             outline = await self.llm_service.generate_json(
                 prompt,
-                system_prompt="You are an expert content strategist who creates SEO-optimized article structures."
+                system_prompt=_OUTLINE_SYSTEM,
+                cache_system=True
             )
             
             # Validate the outline structure and calculate totals
@@ -140,52 +226,27 @@ Return ONLY the JSON object."""
             total_wc = sum(s.get('word_count', 0) for s in outline.get('sections', []))
             
             # Log success with key metrics
-            print(f"✅ Outline generated:")
-            print(f"   - H1: {outline.get('h1', 'N/A')[:60]}...")
-            print(f"   - {section_count} sections, ~{total_wc} total words")
+            logger.info(
+                "✅ Outline generated:\n   - H1: %s...\n   - %d sections, ~%d total words",
+                outline.get('h1', 'N/A')[:60], section_count, total_wc
+            )
             
+            # Only real outlines are cached; the fallback below is not
+            self._outline_cache.set(cache_key, copy.deepcopy(outline))
             return outline
             
         except Exception as e:
             # If LLM generation fails, return a generic but valid outline
             # This ensures the pipeline never completely fails
-            print(f"❌ Outline generation failed: {e}")
-            print("   Using fallback outline template...")
+            logger.error("❌ Outline generation failed: %s", e)
+            logger.warning("   Using fallback outline template...")
             
             # Fallback outline uses topic to create basic structure
             # This is functional but less optimized than LLM-generated outline
+            topic_title = topic.title()
             return {
-                "h1": f"The Complete Guide to {topic.title()}",
+                "h1": f"The Complete Guide to {topic_title}",
                 "sections": [
-                    {
-                        "h2": "Introduction",
-                        "h3s": [],
-                        "word_count": 200,
-                        "key_points": [f"Define {topic}", "Explain importance", "Overview of article"]
-                    },
-                    {
-                        "h2": f"Understanding {topic.title()}",
-                        "h3s": ["Key Concepts", "Common Terminology"],
-                        "word_count": 300,
-                        "key_points": ["Explain fundamentals", "Provide context", "Share examples"]
-                    },
-                    {
-                        "h2": f"Benefits of {topic.title()}",
-                        "h3s": [],
-                        "word_count": 250,
-                        "key_points": ["List main benefits", "Provide evidence", "Share statistics"]
-                    },
-                    {
-                        "h2": f"Best Practices for {topic.title()}",
-                        "h3s": ["Getting Started", "Advanced Tips"],
-                        "word_count": 400,
-                        "key_points": ["Step-by-step guidance", "Expert recommendations", "Common pitfalls"]
-                    },
-                    {
-                        "h2": "Conclusion",
-                        "h3s": [],
-                        "word_count": 150,
-                        "key_points": ["Summarize key takeaways", "Encourage action", "Future outlook"]
-                    }
+                    section.render(topic, topic_title) for section in _FALLBACK_SECTIONS
                 ]
             }
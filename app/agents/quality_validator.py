@@ -48,10 +48,61 @@ Scoring:
 This validation ensures every article meets professional SEO standards.
 """
 
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Tuple
+import logging
 import re  # For word-boundary matching and proper sentence counting
 from app.models.response import ArticleContent, SEOMetadata
 
+logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=256)
+def _keyword_pattern(keyword: str) -> "re.Pattern":
+    """Compile (once per keyword) a case-insensitive whole-phrase pattern.
+    
+    Word boundaries avoid false matches (e.g., 'cat' in 'caterpillar'), and
+    IGNORECASE avoids lowercasing full-text-sized copies of the article.
+    """
+    return re.compile(r'\b' + re.escape(keyword.lower()) + r'\b', re.IGNORECASE)
+
+@lru_cache(maxsize=256)
+def _scan_pattern(keyword: str) -> "re.Pattern":
+    """Compile (once per keyword) the fused keyword + sentence-end pattern.
+    
+    One alternation with named groups lets a single finditer() pass over the
+    article count both keyword occurrences ("kw") and sentence terminators
+    ("sent"), instead of one full scan per metric. A sentence ends at . ! ?
+    followed by space and a capital letter (or end of text); the capital
+    check is scoped case-sensitive despite the pattern's IGNORECASE.
+    """
+    return re.compile(
+        r'(?P<kw>\b' + re.escape(keyword.lower()) + r'\b)'
+        r'|(?P<sent>[.!?](?=\s+(?-i:[A-Z])|\s*$))',
+        re.IGNORECASE
+    )
+
+def _scan_text(text: str, keyword: str) -> Tuple[int, int]:
+    """Count keyword occurrences and sentence ends in a single pass.
+    
+    The text-scanning kernel of the validator: everything that has to walk
+    the whole article (criteria 7 and 8) is fused into one finditer() over
+    the _scan_pattern alternation, so the article is read once.
+    
+    Args:
+        text: Full article text
+        keyword: Focus keyword (matched case-insensitively, whole phrase)
+    
+    Returns:
+        Tuple of (keyword_count, sentence_count)
+    """
+    keyword_count = sentence_count = 0
+    for match in _scan_pattern(keyword).finditer(text):
+        if match.lastgroup == "kw":
+            keyword_count += 1
+        else:
+            sentence_count += 1
+    return keyword_count, sentence_count
+
 class QualityValidator:
     """Validates article quality against 8 SEO best practice criteria.
     
@@ -130,16 +181,15 @@ class QualityValidator:
         # 3. Primary keyword in H1 (15 points)
         # Use word boundaries to avoid false matches (e.g., 'cat' in 'caterpillar')
         # \b ensures we match whole words/phrases only
-        keyword_pattern = r'\b' + re.escape(metadata.focus_keyword.lower()) + r'\b'
-        if re.search(keyword_pattern, article.h1.lower()):
+        keyword_re = _keyword_pattern(metadata.focus_keyword)
+        if keyword_re.search(article.h1):
             score += 15
         else:
             issues.append("Primary keyword not found in H1")
         
         # 4. Keyword in first 100 words (15 points)
         # Use word boundaries to avoid false matches
-        first_100 = ' '.join(article.full_text.split()[:100])
-        if re.search(keyword_pattern, first_100.lower()):
+        if keyword_re.search(article.first_100_words):  # Cached on the article
             score += 15
         else:
             issues.append("Primary keyword not in first 100 words")
@@ -166,8 +216,8 @@ class QualityValidator:
         #   → To hit 1% in 2000-word article, need 20 appearances = stuffing penalty
         # Use word boundaries to count only exact keyword matches
         # Prevents 'cat' from matching inside 'education', 'location', 'caterpillar'
-        content_lower = article.full_text.lower()
-        keyword_count = len(re.findall(keyword_pattern, content_lower))
+        # Keyword and sentence-end counts (criterion 8) come from ONE scan
+        keyword_count, sentence_count = _scan_text(article.full_text, metadata.focus_keyword)
         density = (keyword_count / article.word_count) * 100 if article.word_count > 0 else 0
         
         # Dynamic threshold based on keyword length
@@ -190,8 +240,7 @@ class QualityValidator:
         # - Decimals: 3.5, 10.2
         # - Email addresses: user@example.com
         # Pattern: Match . ! ? followed by space and capital letter (real sentence end)
-        sentence_pattern = r'[.!?](?=\s+[A-Z]|\s*$)'
-        sentence_count = len(re.findall(sentence_pattern, article.full_text))
+        # (sentence_count was counted in the criterion 7 scan)
         
         # Fallback: if regex finds 0 sentences (edge case), use word count heuristic
         if sentence_count == 0:
@@ -212,13 +261,17 @@ class QualityValidator:
         percentage = round((score / max_score) * 100, 1)
         passed = score >= 70
         
-        print(f"\n📋 Quality Validation Results:")
-        print(f"   Score: {score}/{max_score} ({percentage}%)")
-        print(f"   Status: {'✅ PASSED' if passed else '❌ NEEDS IMPROVEMENT'}")
-        if issues:
-            print(f"   Issues found: {len(issues)}")
-            for issue in issues[:3]:  # Show first 3 issues
-                print(f"      - {issue}")
+        # One log record per validation (built only if INFO is enabled)
+        if logger.isEnabledFor(logging.INFO):
+            lines = [
+                "\n📋 Quality Validation Results:",
+                f"   Score: {score}/{max_score} ({percentage}%)",
+                f"   Status: {'✅ PASSED' if passed else '❌ NEEDS IMPROVEMENT'}"
+            ]
+            if issues:
+                lines.append(f"   Issues found: {len(issues)}")
+                lines.extend(f"      - {issue}" for issue in issues[:3])  # Show first 3 issues
+            logger.info("\n".join(lines))
         
         return {
             "score": score,
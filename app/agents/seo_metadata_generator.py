@@ -30,42 +30,59 @@ Why This Matters:
     - Keyword density = Relevance signal (but avoid stuffing)
 """
 
-from typing import Dict, List
-from app.services.llm_service import LLMService
+import asyncio
+from typing import Dict, List, Optional, Tuple
+from app.services.llm_service import LLMService, get_llm_service
+from app.services.semantic_cache import get_semantic_cache
+from app.utils.excerpt import select_excerpt
+from app.utils.text import count_keywords, word_count
 from app.models.response import (
     SEOMetadata, KeywordAnalysis, InternalLink, ExternalReference
 )
+from pydantic import TypeAdapter
+import logging
 
-class SEOMetadataGenerator:
-    """Generates all SEO-critical metadata and link strategies for articles.
+logger = logging.getLogger(__name__)
+
+# Validators for the LLM's JSON (compiled once). Missing fields get the
+# defaults below; wrongly typed values fail validation and are retried
+# by generate_json instead of silently producing half-empty suggestions.
+_METADATA_ADAPTER = TypeAdapter(SEOMetadata)
+_LINKS_ADAPTER = TypeAdapter(List[InternalLink])
+_REFERENCES_ADAPTER = TypeAdapter(List[ExternalReference])
+_LINK_DEFAULTS = {"anchor_text": "", "suggested_target": "", "context": ""}
+_REFERENCE_DEFAULTS = {"source_name": "", "url": "", "context": "", "placement_suggestion": ""}
+
+def _validate_items(
+    adapter: TypeAdapter, 
+    data, 
+    key: str, 
+    defaults: Dict[str, str], 
+    limit: int
+) -> list:
+    """Validate the first `limit` objects of data[key] with adapter (missing fields from defaults).
     
-    This is a multi-purpose agent handling 4 different generation tasks
-    (metadata, internal links, external refs, keyword analysis).
+    Raises:
+        ValueError: If the response isn't an object holding a list of objects,
+                    or an item fails validation (pydantic.ValidationError)
     """
-    
-    def __init__(self):
-        self.llm_service = LLMService()
-    
-    async def generate_seo_metadata(
-        self, 
-        article_content: str, 
-        h1: str,
-        primary_keyword: str
-    ) -> SEOMetadata:
-        """Generate SEO title tag and meta description"""
-        
-        prompt = f"""Generate SEO metadata for this article:
+    items = data.get(key, []) if isinstance(data, dict) else None
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        raise ValueError(f'Expected "{key}" to be an array of objects')
+    return adapter.validate_python([{**defaults, **item} for item in items[:limit]])
 
-Article Title (H1): {h1}
-Primary Keyword: {primary_keyword}
-Article Preview (first 250 chars): {article_content[:250]}
+# Static instruction blocks (JSON schema + requirements). Each is sent as a
+# cache-breakpoint prefix ahead of the per-article values, so it must not
+# contain anything request-specific. All three are well under Sonnet's
+# 1024-token caching minimum, so none of them is actually cached today.
+_METADATA_INSTRUCTIONS = """Generate SEO metadata for the article described below.
 
 Create the following (return as JSON):
-{{
+{
   "title_tag": "SEO title (50-60 characters, include primary keyword near the start)",
   "meta_description": "Compelling meta description (EXACTLY 155 characters, include keyword, call-to-action)",
   "focus_keyword": "Primary keyword phrase"
-}}
+}
 
 REQUIREMENTS:
 - Title tag: 50-60 characters, engaging, includes primary keyword
@@ -74,48 +91,18 @@ REQUIREMENTS:
 
 Return ONLY the JSON object."""
 
-        try:
-            metadata_dict = await self.llm_service.generate_json(
-                prompt,
-                system_prompt="You are an SEO expert who creates compelling meta tags that improve click-through rates."
-            )
-            
-            return SEOMetadata(
-                title_tag=metadata_dict.get("title_tag", h1[:60]),
-                meta_description=metadata_dict.get("meta_description", ""),
-                focus_keyword=metadata_dict.get("focus_keyword", primary_keyword)
-            )
-            
-        except Exception as e:
-            print(f"⚠️  SEO metadata generation failed: {e}, using fallback")
-            return SEOMetadata(
-                title_tag=h1[:60] if len(h1) <= 60 else h1[:57] + "...",
-                meta_description=f"Learn everything about {primary_keyword}. Complete guide with tips, strategies, and best practices.",
-                focus_keyword=primary_keyword
-            )
-    
-    async def generate_internal_links(
-        self, 
-        article_content: str, 
-        topic: str
-    ) -> List[InternalLink]:
-        """Generate internal link suggestions"""
-        
-        prompt = f"""Suggest 3-5 internal links for this article about "{topic}".
-
-Article excerpt (first 500 characters):
-{article_content[:500]}...
+_INTERNAL_LINK_INSTRUCTIONS = """Suggest 3-5 internal links for the article described below.
 
 For each internal link, provide (return as JSON):
-{{
+{
   "links": [
-    {{
+    {
       "anchor_text": "3-6 word anchor text",
       "suggested_target": "Descriptive page/topic to link to",
       "context": "Where and why this link makes sense in the article"
-    }}
+    }
   ]
-}}
+}
 
 REQUIREMENTS:
 - Suggest links to related, relevant content
@@ -125,39 +112,7 @@ REQUIREMENTS:
 
 Return ONLY the JSON object."""
 
-        try:
-            links_data = await self.llm_service.generate_json(
-                prompt,
-                system_prompt="You are an SEO expert who creates natural, valuable internal linking strategies."
-            )
-            
-            return [
-                InternalLink(
-                    anchor_text=link.get("anchor_text", ""),
-                    suggested_target=link.get("suggested_target", ""),
-                    context=link.get("context", "")
-                )
-                for link in links_data.get("links", [])[:5]
-            ]
-            
-        except Exception as e:
-            print(f"⚠️  Internal link generation failed: {e}, using fallback")
-            return [
-                InternalLink(
-                    anchor_text=f"{topic} best practices",
-                    suggested_target=f"/blog/{topic.replace(' ', '-')}-best-practices",
-                    context="Link when discussing implementation strategies"
-                )
-            ]
-    
-    async def generate_external_references(
-        self, 
-        article_content: str, 
-        topic: str
-    ) -> List[ExternalReference]:
-        """Generate external reference suggestions"""
-        
-        prompt = f"""Suggest 2-4 authoritative external sources to cite for an article about "{topic}".
+_EXTERNAL_REFERENCE_INSTRUCTIONS = """Suggest 2-4 authoritative external sources to cite for the article topic given below.
 
 Focus on credible sources like:
 - Industry research reports
@@ -167,16 +122,16 @@ Focus on credible sources like:
 - Official documentation
 
 For each source, provide (return as JSON):
-{{
+{
   "references": [
-    {{
+    {
       "source_name": "Publication or organization name",
       "url": "Realistic URL (use actual domains like harvard.edu, .gov sites, forbes.com)",
       "context": "What information/data this source provides",
       "placement_suggestion": "Where in the article to cite this (intro, specific section, etc.)"
-    }}
+    }
   ]
-}}
+}
 
 REQUIREMENTS:
 - Suggest 2-4 authoritative sources
@@ -186,42 +141,239 @@ REQUIREMENTS:
 
 Return ONLY the JSON object."""
 
+class SEOMetadataGenerator:
+    """Generates all SEO-critical metadata and link strategies for articles.
+    
+    This is a multi-purpose agent handling 4 different generation tasks
+    (metadata, internal links, external refs, keyword analysis).
+    """
+    
+    def __init__(self, llm_service: Optional[LLMService] = None):
+        # Injected by the orchestrator so all agents share one service
+        self.llm_service = llm_service or get_llm_service()
+        # Link/reference suggestions depend on the topic, so near-duplicate
+        # topics reuse earlier suggestions instead of another LLM call
+        self.semantic_cache = get_semantic_cache()
+    
+    async def generate_all(
+        self,
+        article_content: str,
+        h1: str,
+        topic: str,
+        primary_keyword: str
+    ) -> Tuple[SEOMetadata, List[InternalLink], List[ExternalReference]]:
+        """Generate metadata, internal links and external references concurrently.
+        
+        The three LLM calls share no data, so they are issued together and
+        take about as long as the slowest one. A failure in one falls back
+        for that part only; the other two results are kept.
+        
+        Args:
+            article_content: Article text (its opening is enough)
+            h1: Article title
+            topic: User's topic
+            primary_keyword: Main keyword from SERP analysis
+        
+        Returns:
+            Tuple of (SEOMetadata, internal links, external references)
+        """
+        metadata, links, refs = await asyncio.gather(
+            self._request_seo_metadata(article_content, h1, primary_keyword),
+            self._request_internal_links(article_content, topic, primary_keyword),
+            self._request_external_references(article_content, topic, primary_keyword),
+            return_exceptions=True
+        )
+        
+        if isinstance(metadata, Exception):
+            logger.warning("⚠️  SEO metadata generation failed: %s, using fallback", metadata)
+            metadata = self._fallback_seo_metadata(h1, primary_keyword)
+        if isinstance(links, Exception):
+            logger.warning("⚠️  Internal link generation failed: %s, using fallback", links)
+            links = self._fallback_internal_links(topic)
+        if isinstance(refs, Exception):
+            logger.warning("⚠️  External reference generation failed: %s, using fallback", refs)
+            refs = self._fallback_external_references(topic)
+        
+        return metadata, links, refs
+    
+    async def generate_seo_metadata(
+        self, 
+        article_content: str, 
+        h1: str,
+        primary_keyword: str
+    ) -> SEOMetadata:
+        """Generate SEO title tag and meta description"""
         try:
-            refs_data = await self.llm_service.generate_json(
-                prompt,
-                system_prompt="You are a research expert who identifies authoritative sources for content credibility."
-            )
-            
-            return [
-                ExternalReference(
-                    source_name=ref.get("source_name", ""),
-                    url=ref.get("url", ""),
-                    context=ref.get("context", ""),
-                    placement_suggestion=ref.get("placement_suggestion", "")
-                )
-                for ref in refs_data.get("references", [])[:4]
-            ]
-            
+            return await self._request_seo_metadata(article_content, h1, primary_keyword)
+        except Exception as e:
+            logger.warning("⚠️  SEO metadata generation failed: %s, using fallback", e)
+            return self._fallback_seo_metadata(h1, primary_keyword)
+    
+    async def _request_seo_metadata(
+        self, 
+        article_content: str, 
+        h1: str,
+        primary_keyword: str
+    ) -> SEOMetadata:
+        """Ask the LLM for SEO metadata (raises on failure)"""
+        
+        # Only the article-specific values follow the cached instructions
+        prompt = f"""Article Title (H1): {h1}
+Primary Keyword: {primary_keyword}
+Article Preview: {select_excerpt(article_content, 60, primary_keyword)}"""
+
+        defaults = {"title_tag": h1[:60], "meta_description": "", "focus_keyword": primary_keyword}
+        
+        def validate(data) -> SEOMetadata:
+            if not isinstance(data, dict):
+                raise ValueError("Expected a JSON object of SEO metadata")
+            return _METADATA_ADAPTER.validate_python({**defaults, **data})
+        
+        return await self.llm_service.generate_json(
+            prompt,
+            system_prompt="You are an SEO expert who creates compelling meta tags that improve click-through rates.",
+            cached_prefix=_METADATA_INSTRUCTIONS,
+            validate=validate
+        )
+    
+    async def generate_internal_links(
+        self, 
+        article_content: str, 
+        topic: str,
+        primary_keyword: Optional[str] = None
+    ) -> List[InternalLink]:
+        """Generate internal link suggestions"""
+        try:
+            return await self._request_internal_links(article_content, topic, primary_keyword or topic)
+        except Exception as e:
+            logger.warning("⚠️  Internal link generation failed: %s, using fallback", e)
+            return self._fallback_internal_links(topic)
+    
+    async def _request_internal_links(
+        self, 
+        article_content: str, 
+        topic: str,
+        primary_keyword: str
+    ) -> List[InternalLink]:
+        """Internal link suggestions, from the semantic cache or the LLM (raises on failure).
+        
+        Cached per (topic, primary keyword): similar topics targeting a
+        different keyword get their own suggestions.
+        """
+        return await self.semantic_cache.get_or_compute(
+            "internal_links", topic,
+            lambda: self._request_internal_links_uncached(article_content, topic, primary_keyword),
+            bucket=primary_keyword.strip().lower()
+        )
+    
+    async def _request_internal_links_uncached(
+        self, 
+        article_content: str, 
+        topic: str,
+        primary_keyword: str
+    ) -> List[InternalLink]:
+        """Ask the LLM for internal link suggestions (raises on failure)"""
+        
+        prompt = f"""Article topic: "{topic}"
+Primary keyword: "{primary_keyword}"
+
+Article excerpt:
+{select_excerpt(article_content, 125, topic)}..."""
+
+        return await self.llm_service.generate_json(
+            prompt,
+            system_prompt="You are an SEO expert who creates natural, valuable internal linking strategies.",
+            cached_prefix=_INTERNAL_LINK_INSTRUCTIONS,
+            validate=lambda data: _validate_items(_LINKS_ADAPTER, data, "links", _LINK_DEFAULTS, 5)
+        )
+    
+    async def generate_external_references(
+        self, 
+        article_content: str, 
+        topic: str,
+        primary_keyword: Optional[str] = None
+    ) -> List[ExternalReference]:
+        """Generate external reference suggestions"""
+        try:
+            return await self._request_external_references(article_content, topic, primary_keyword or topic)
         except Exception as e:
-            print(f"⚠️  External reference generation failed: {e}, using fallback")
-            return [
-                ExternalReference(
-                    source_name="Industry Research Report",
-                    url=f"https://research.example.com/{topic.replace(' ', '-')}-report",
-                    context=f"Statistics and trends in {topic}",
-                    placement_suggestion="Cite in introduction to establish credibility"
-                )
-            ]
+            logger.warning("⚠️  External reference generation failed: %s, using fallback", e)
+            return self._fallback_external_references(topic)
+    
+    async def _request_external_references(
+        self, 
+        article_content: str, 
+        topic: str,
+        primary_keyword: str
+    ) -> List[ExternalReference]:
+        """External reference suggestions, from the semantic cache or the LLM (raises on failure).
+        
+        Cached per (topic, primary keyword), like internal links.
+        """
+        return await self.semantic_cache.get_or_compute(
+            "external_references", topic,
+            lambda: self._request_external_references_uncached(topic, primary_keyword),
+            bucket=primary_keyword.strip().lower()
+        )
+    
+    async def _request_external_references_uncached(self, topic: str, primary_keyword: str) -> List[ExternalReference]:
+        """Ask the LLM for external reference suggestions (raises on failure)"""
+        
+        prompt = f'Article topic: "{topic}"\nPrimary keyword: "{primary_keyword}"'
+
+        return await self.llm_service.generate_json(
+            prompt,
+            system_prompt="You are a research expert who identifies authoritative sources for content credibility.",
+            cached_prefix=_EXTERNAL_REFERENCE_INSTRUCTIONS,
+            validate=lambda data: _validate_items(
+                _REFERENCES_ADAPTER, data, "references", _REFERENCE_DEFAULTS, 4
+            )
+        )
+    
+    @staticmethod
+    def _fallback_seo_metadata(h1: str, primary_keyword: str) -> SEOMetadata:
+        """Template metadata used when the LLM call fails"""
+        return SEOMetadata(
+            title_tag=h1[:60] if len(h1) <= 60 else h1[:57] + "...",
+            meta_description=f"Learn everything about {primary_keyword}. Complete guide with tips, strategies, and best practices.",
+            focus_keyword=primary_keyword
+        )
+    
+    @staticmethod
+    def _fallback_internal_links(topic: str) -> List[InternalLink]:
+        """Template internal link used when the LLM call fails"""
+        return [
+            InternalLink(
+                anchor_text=f"{topic} best practices",
+                suggested_target=f"/blog/{topic.replace(' ', '-')}-best-practices",
+                context="Link when discussing implementation strategies"
+            )
+        ]
+    
+    @staticmethod
+    def _fallback_external_references(topic: str) -> List[ExternalReference]:
+        """Template external reference used when the LLM call fails"""
+        return [
+            ExternalReference(
+                source_name="Industry Research Report",
+                url=f"https://research.example.com/{topic.replace(' ', '-')}-report",
+                context=f"Statistics and trends in {topic}",
+                placement_suggestion="Cite in introduction to establish credibility"
+            )
+        ]
     
     def analyze_keywords(
         self, 
         article_content: str, 
         primary_keyword: str, 
-        secondary_keywords: List[str]
+        secondary_keywords: List[str],
+        total_words: Optional[int] = None
     ) -> KeywordAnalysis:
         """Calculate keyword density and distribution across the article.
         
-        This is a non-LLM method - uses simple string counting and math.
+        This is a non-LLM method - uses string counting and math.
+        All keywords (primary + secondary) are counted in a single pass over
+        the text, so cost doesn't grow with the number of keywords.
         
         Keyword Density Formula:
             (Keyword Count / Total Words) × 100 = Density %
@@ -235,12 +387,15 @@ Return ONLY the JSON object."""
             article_content: Full article text
             primary_keyword: Main keyword phrase (e.g., "productivity tools")
             secondary_keywords: Related terms (e.g., ["remote work", "collaboration"])
+            total_words: Known word count of the article (e.g., ArticleContent.word_count);
+                         counted from article_content when omitted
         
         Returns:
             KeywordAnalysis with:
             - primary_keyword: The main keyword
             - secondary_keywords: List of related terms
             - keyword_density: Percentage (e.g., 1.8 for 1.8%)
+            - keyword_counts: Occurrences of every keyword (e.g., {"remote work": 12})
         
         Example:
             Article: 1500 words, keyword appears 25 times
@@ -248,19 +403,26 @@ Return ONLY the JSON object."""
             Result: Good! Within 1-2.5% target range
         """
         
-        content_lower = article_content.lower()
-        primary_count = content_lower.count(primary_keyword.lower())
-        total_words = len(article_content.split())
+        keyword_counts = count_keywords(article_content, [primary_keyword] + secondary_keywords)
+        primary_count = keyword_counts[primary_keyword]
+        if total_words is None:
+            total_words = word_count(article_content)
         
         # Calculate density as percentage
         density = (primary_count / total_words) * 100 if total_words > 0 else 0
         
-        print(f"📊 Keyword Analysis:")
-        print(f"   - Primary keyword '{primary_keyword}' appears {primary_count} times")
-        print(f"   - Keyword density: {density:.2f}%")
+        logger.info(
+            "📊 Keyword Analysis: '%s' appears %d times in %d words (density %.2f%%)",
+            primary_keyword, primary_count, total_words, density
+        )
+        if secondary_keywords and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("   - Secondary keyword counts: %s", ", ".join(
+                f"'{kw}' ×{keyword_counts[kw]}" for kw in secondary_keywords
+            ))
         
         return KeywordAnalysis(
             primary_keyword=primary_keyword,
             secondary_keywords=secondary_keywords,
-            keyword_density=round(density, 2)
+            keyword_density=round(density, 2),
+            keyword_counts=keyword_counts
         )
@@ -1,16 +1,89 @@
-from pydantic_settings import BaseSettings
-from functools import lru_cache
+from dataclasses import dataclass
+from dotenv import load_dotenv
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+import atexit
+import logging
+import os
+import queue
+import sys
 
-class Settings(BaseSettings):
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """App configuration, read once from the environment (and .env).
+    
+    A plain frozen dataclass instead of pydantic-settings keeps worker
+    cold starts cheap - there are only a handful of string/bool values.
+    """
     anthropic_api_key: str
     serpapi_key: str = ""
     database_url: str = "sqlite:///./seo_content.db"
     environment: str = "development"
     mock_llm: bool = False
-    
-    class Config:
-        env_file = ".env"
+    log_level: str = "INFO"
+    generation_workers: int = 4  # Article pipelines run concurrently per process
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    """Parse a boolean env var ("true"/"1"/"yes"/"on", case-insensitive)."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+def _load_settings() -> Settings:
+    """Build Settings from the environment, with .env filling in unset values."""
+    load_dotenv(".env", override=False)
+    return Settings(
+        anthropic_api_key=os.environ["ANTHROPIC_API_KEY"],
+        serpapi_key=os.environ.get("SERPAPI_KEY", ""),
+        database_url=os.environ.get("DATABASE_URL", "sqlite:///./seo_content.db"),
+        environment=os.environ.get("ENVIRONMENT", "development"),
+        mock_llm=_env_bool("MOCK_LLM"),
+        log_level=os.environ.get("LOG_LEVEL", "INFO"),
+        generation_workers=int(os.environ.get("GENERATION_WORKERS", "4"))
+    )
+
+# Loaded once, when the module is first imported (worker start-up), so no
+# request ever pays for reading .env or parsing the environment
+settings = _load_settings()
+
+def get_settings() -> Settings:
+    """Return the process-wide Settings loaded at import time."""
+    return settings
+
+# Background thread that drains queued log records to stdout
+_log_listener: Optional[QueueListener] = None
+
+def configure_logging():
+    """Configure root logging for the app's module-level loggers.
+
+    Level comes from LOG_LEVEL (default INFO); DEBUG additionally shows
+    per-section progress. Messages keep the emoji-prefixed console style.
+
+    The httpx/httpcore loggers are capped at WARNING so request URLs (which
+    carry the SerpAPI key) never reach the logs.
+
+    Records are put on an in-memory queue and written to stdout by a single
+    QueueListener thread, so concurrent jobs never block on (or interleave
+    partial) console writes. Safe to call more than once.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, get_settings().log_level.upper(), logging.INFO))
+    root.addHandler(QueueHandler(log_queue))
+    # httpx logs every request URL at INFO, and SerpAPI takes its key as a
+    # query parameter - keep the HTTP client libraries to warnings only
+    for name in ("httpx", "httpcore"):
+        logging.getLogger(name).setLevel(logging.WARNING)
 
-@lru_cache()
-def get_settings():
-    return Settings()
\ No newline at end of file
+    _log_listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _log_listener.start()
+    # Flush anything still queued when the process exits
+    atexit.register(_log_listener.stop)
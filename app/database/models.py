@@ -13,7 +13,7 @@ Key Features:
     - Checkpoint system (saves SERP and outline data mid-process)
     - Resumable generation (can restart from checkpoint if crashed)
     - JSON storage for complex nested data structures
-    - Dependency injection pattern for FastAPI integration
+    - Request-scoped sessions for FastAPI (request_session_scope + SessionScoped)
 
 Schema Design:
     ArticleJob table stores everything about a generation request:
@@ -24,26 +24,62 @@ Schema Design:
     - Error messages (if generation failed)
 """
 
-from sqlalchemy import Column, String, Integer, DateTime, Text, JSON, Enum as SQLEnum, create_engine
+from sqlalchemy import Column, String, Integer, DateTime, Text, JSON, LargeBinary, Enum as SQLEnum, create_engine, event, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from datetime import datetime
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.types import TypeDecorator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Optional
 import enum
+import zlib
 from app.config import get_settings
+from app.utils import fast_json
 
 # Base class for all ORM models
 Base = declarative_base()
 
+class CompressedJSON(TypeDecorator):
+    """JSON value stored as zlib-compressed bytes.
+    
+    Used for the large columns (SERP checkpoint, outline, final article):
+    article prose and SERP JSON compress several-fold, so every checkpoint
+    write and result read moves far fewer bytes through SQLite and its WAL.
+    
+    Rows written before compression (plain JSON text) are still read.
+    """
+    impl = LargeBinary
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return zlib.compress(fast_json.dumps(value).encode("utf-8"))
+    
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return fast_json.loads(value)  # Legacy uncompressed row
+        try:
+            value = zlib.decompress(value)
+        except zlib.error:
+            pass  # Legacy uncompressed JSON returned as bytes
+        return fast_json.loads(value)
+
 class JobStatusEnum(enum.Enum):
     """Job status enumeration tracking generation lifecycle.
     
     Status Flow:
         PENDING → RUNNING → COMPLETED (success path)
         PENDING → RUNNING → FAILED (error occurred)
+        FAILED → PENDING (POST /job/{id}/retry; resumes from checkpoints)
     
     Never:
         - PENDING to COMPLETED (must go through RUNNING)
-        - FAILED to RUNNING (failed jobs stay failed)
+        - FAILED to RUNNING (a retry re-queues the job as PENDING first)
         - COMPLETED to RUNNING (completed jobs don't re-run)
     """
     PENDING = "pending"      # Job created, queued for processing
@@ -58,17 +94,20 @@ class ArticleJob(Base):
     enabling async processing, checkpointing, and result retrieval.
     
     Checkpoint System:
-        serp_data saved after Step 1 (SERP analysis complete)
+        serp_data saved after Step 1 (SERP fetch complete)
+        analysis_data saved after Step 2 (SERP analysis complete)
         outline_data saved after Step 3 (outline generation complete)
+        pipeline_version records which pipeline produced the checkpoints
         
-        If generation crashes, we could resume from last checkpoint
-        instead of starting over. Currently not implemented but the
-        data structure supports it.
+        If the same job is run again, the orchestrator resumes from the
+        last checkpoint instead of starting over - but only when
+        pipeline_version matches the current code.
     
     JSON Storage:
-        SQLite stores JSON as TEXT internally, SQLAlchemy handles conversion.
         Fields like serp_data, outline_data, and result can store complex
-        nested dictionaries/arrays without needing separate tables.
+        nested dictionaries/arrays without needing separate tables. The
+        large ones are stored zlib-compressed (CompressedJSON); the small
+        analysis_data stays a plain JSON column.
     """
     __tablename__ = "article_jobs"
     
@@ -82,16 +121,18 @@ class ArticleJob(Base):
     
     # Job Status Tracking
     status = Column(SQLEnum(JobStatusEnum), default=JobStatusEnum.PENDING)
-    created_at = Column(DateTime, default=datetime.utcnow)  # When job was created
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)  # When job was created (UTC)
     completed_at = Column(DateTime, nullable=True)  # When job finished (success or failure)
     
     # Checkpoint Data - saved mid-process for debugging and potential resume
     # Stored as JSON to handle complex nested structures
-    serp_data = Column(JSON, nullable=True)     # Step 1: SERP analysis results
-    outline_data = Column(JSON, nullable=True)  # Step 3: Article outline structure
+    serp_data = Column(CompressedJSON, nullable=True)     # Step 1: SERP results
+    analysis_data = Column(JSON, nullable=True)  # Step 2: SERP analysis (keywords, topics)
+    outline_data = Column(CompressedJSON, nullable=True)  # Step 3: Article outline structure
+    pipeline_version = Column(String, nullable=True)  # Pipeline that wrote the checkpoints
     
     # Final Results - only populated when status=COMPLETED or FAILED
-    result = Column(JSON, nullable=True)  # Complete ArticleOutput with all sections
+    result = Column(CompressedJSON, nullable=True)  # Complete ArticleOutput with all sections
     error = Column(Text, nullable=True)   # Error message if status=FAILED
 
 # Database Setup - creates engine and session factory
@@ -100,18 +141,80 @@ settings = get_settings()
 
 # Create SQLAlchemy engine
 # - SQLite: check_same_thread=False allows multi-threaded access
+# - QueuePool: a few long-lived connections are reused across requests
+#   (LIFO hands out the most recently used, still-warm one) instead of
+#   reopening the database file - and its -wal/-shm files - per request.
+#   In-memory SQLite keeps its default single-connection pool, since every
+#   new connection would otherwise see a separate empty database.
+# - pool_pre_ping: PostgreSQL only - server connections can be dropped
+#   (restarts, idle timeouts), so each checkout is tested first. A local
+#   SQLite file can't drop a connection, so the extra SELECT 1 is skipped.
 # - echo=False: Disable SQL query logging (set True for debugging)
+_pool_args = {} if ":memory:" in settings.database_url else {
+    "poolclass": QueuePool,
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_recycle": 3600,  # Seconds before a connection is replaced
+    "pool_use_lifo": True
+}
+if settings.database_url.startswith("postgres"):
+    _pool_args["pool_pre_ping"] = True
 engine = create_engine(
     settings.database_url,  # e.g., "sqlite:///./seo_content.db"
     connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
-    echo=False  # Set to True to see all SQL queries
+    echo=False,  # Set to True to see all SQL queries
+    # JSON columns (checkpoints, results) via orjson when available
+    json_serializer=fast_json.dumps,
+    json_deserializer=fast_json.loads,
+    **_pool_args
 )
 
+if "sqlite" in settings.database_url:
+    @event.listens_for(engine, "connect")
+    def _configure_sqlite(dbapi_connection, connection_record):
+        """Tune every new SQLite connection for concurrent polling + checkpoint writes.
+        
+        - WAL: readers (GET /job polling) no longer block on, or block, the
+          pipeline's status/checkpoint writes
+        - synchronous=NORMAL: safe with WAL, fsyncs only at checkpoints
+        - 64 MB page cache, in-memory temp tables, 256 MB memory map
+        - busy_timeout: wait up to 5s for a lock instead of failing at once
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.close()
+
 # Session factory - creates new database sessions
 # autocommit=False: Require explicit .commit() calls
 # autoflush=False: Manual control over when changes are flushed
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Request-scoped sessions for the API endpoints. The scope is a ContextVar
+# (set per request by request_session_scope) rather than the thread, since
+# many async requests share the event loop thread and must not share a session.
+_session_scope: ContextVar[Optional[object]] = ContextVar("db_session_scope", default=None)
+SessionScoped = scoped_session(SessionLocal, scopefunc=_session_scope.get)
+
+@contextmanager
+def request_session_scope():
+    """Give the enclosed request its own SessionScoped() session.
+    
+    Used by the HTTP middleware in app/main.py: endpoints call
+    SessionScoped() directly, and the session is closed and discarded
+    (SessionScoped.remove()) once the response is produced.
+    """
+    token = _session_scope.set(object())  # Unique key for this request
+    try:
+        yield
+    finally:
+        SessionScoped.remove()
+        _session_scope.reset(token)
+
 def init_db():
     """Initialize database by creating all tables.
     
@@ -123,30 +226,44 @@ def init_db():
         - First API request (via lazy initialization)
     """
     Base.metadata.create_all(bind=engine)
+    _upgrade_schema(engine)
     print("✅ Database initialized successfully")
 
-def get_db():
-    """Database session dependency for FastAPI endpoints.
-    
-    This is a generator function that:
-    1. Creates a new SQLAlchemy session
-    2. Yields it to the endpoint (via Depends(get_db))
-    3. Closes the session when endpoint completes
-    
-    Usage in endpoints:
-        @app.get("/job/{job_id}")
-        async def get_job(job_id: str, db: Session = Depends(get_db)):
-            job = db.query(ArticleJob).filter(ArticleJob.id == job_id).first()
-            return job
-    
-    Benefits:
-        - Automatic session lifecycle management
-        - Ensures connections are properly closed
-        - Prevents connection leaks in long-running apps
-        - One session per request (thread-safe)
+def _upgrade_schema(bind):
+    """Bring an article_jobs table created by an older version up to date.
+    
+    create_all() only creates missing tables - it never changes an existing
+    one. Columns added to ArticleJob since (e.g. analysis_data,
+    pipeline_version) are added here with ALTER TABLE ... ADD COLUMN. They
+    are all nullable, so existing rows simply read them as NULL.
+    
+    On PostgreSQL, CompressedJSON columns created as json are converted to
+    bytea, keeping each row's JSON text as its bytes (CompressedJSON reads
+    those uncompressed legacy values). SQLite needs no conversion: its
+    columns accept the compressed bytes whatever their declared type.
+    
+    Args:
+        bind: Engine whose database should be upgraded
     """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()  # Always close, even if endpoint raises exception
\ No newline at end of file
+    table = ArticleJob.__table__
+    with bind.begin() as conn:
+        existing = {column["name"]: column for column in inspect(conn).get_columns(table.name)}
+        quote = conn.dialect.identifier_preparer.quote
+        for column in table.columns:
+            if column.name not in existing:
+                column_type = column.type.compile(dialect=conn.dialect)
+                conn.execute(text(
+                    f"ALTER TABLE {quote(table.name)} ADD COLUMN {quote(column.name)} {column_type}"
+                ))
+                print(f"🔧 Added missing column article_jobs.{column.name}")
+            elif (
+                conn.dialect.name == "postgresql"
+                and isinstance(column.type, CompressedJSON)
+                and not isinstance(existing[column.name]["type"], LargeBinary)
+            ):
+                name = quote(column.name)
+                conn.execute(text(
+                    f"ALTER TABLE {quote(table.name)} ALTER COLUMN {name} "
+                    f"TYPE bytea USING convert_to({name}::text, 'UTF8')"
+                ))
+                print(f"🔧 Converted article_jobs.{column.name} to bytea for compressed JSON")
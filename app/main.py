@@ -11,16 +11,27 @@ background and clients poll for results, preventing timeouts during the
 2-5 minute generation process.
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import insert, select, update
+from typing import List
+import logging
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 
 from app.models.request import ArticleGenerationRequest
-from app.models.response import JobResponse, JobStatus
-from app.database.models import ArticleJob, JobStatusEnum, init_db, get_db
-from app.agents.orchestrator import ArticleGenerationOrchestrator
+from app.models.response import PENDING, JobResponse
+from app.database.models import ArticleJob, JobStatusEnum, SessionScoped, init_db, request_session_scope
+from app.config import configure_logging, get_settings
+from app.services.job_queue import JobQueue
+from app.services.serp_service import close_http_client
+from app.utils.cache import TTLCache
+
+# Route module loggers (logging.getLogger(__name__)) to the console
+configure_logging()
+
+logger = logging.getLogger(__name__)
 
 # Initialize FastAPI application with metadata for auto-generated docs
 app = FastAPI(
@@ -41,18 +52,97 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all headers
 )
 
+# One database session per request: endpoints use SessionScoped(), and the
+# session is removed (closed) after the response is produced
+@app.middleware("http")
+async def scoped_db_session(request: Request, call_next):
+    with request_session_scope():
+        return await call_next(request)
+
 # Lifecycle event: runs once when server starts
 @app.on_event("startup")
-def startup_event():
-    """Initialize the database when the application starts.
+async def startup_event():
+    """Initialize the database and start the generation workers.
     
     Creates all necessary tables if they don't exist.
     This is idempotent - safe to run multiple times.
     """
     init_db()
-    print("\n🚀 SEO Content Generator API Started")
-    print("📚 API Documentation: http://localhost:8000/docs")
-    print("🔗 Alternative Docs: http://localhost:8000/redoc\n")
+    # Response models are defer_build; build the polled one now rather
+    # than on the first GET /job request
+    JobResponse.model_rebuild()
+    await job_queue.start()
+    logger.info("\n🚀 SEO Content Generator API Started")
+    logger.info("📚 API Documentation: http://localhost:8000/docs")
+    logger.info("🔗 Alternative Docs: http://localhost:8000/redoc\n")
+
+# Lifecycle event: runs once when server stops
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the generation workers and close the shared SerpAPI HTTP client."""
+    await job_queue.stop()
+    await close_http_client()
+
+# Database work runs through Starlette's threadpool (run_in_threadpool) so the
+# blocking driver calls never stall the event loop. The SessionScoped scope is
+# a ContextVar, which the threadpool copies, so the thread uses the request's
+# session and the middleware still closes it.
+
+def _insert_jobs(rows: List[dict]) -> List[datetime]:
+    """Insert PENDING job rows with one statement and commit.
+    
+    created_at is filled in by the column default (UTC, set in Python so
+    tables created by older versions behave the same); RETURNING hands the
+    stored values back in the same round trip.
+    
+    Args:
+        rows: Column values per job (id, topic, target_word_count, language, status)
+    
+    Returns:
+        created_at of each inserted job, in the same order as rows
+    """
+    db = SessionScoped()
+    created_ats = db.execute(
+        insert(ArticleJob).returning(ArticleJob.created_at, sort_by_parameter_order=True),
+        rows
+    ).scalars().all()
+    db.commit()
+    return created_ats
+
+def _requeue_failed_job(job_id: str):
+    """Move a FAILED job back to PENDING, clearing its error.
+    
+    The status check and the update are one UPDATE ... WHERE status =
+    FAILED, so concurrent retries of the same job can't both succeed.
+    Checkpoints are kept for the re-run to resume from.
+    
+    Returns:
+        Row with the job's request parameters and created_at, or None if
+        the job doesn't exist or isn't FAILED
+    """
+    db = SessionScoped()
+    job = db.execute(
+        update(ArticleJob)
+        .where(ArticleJob.id == job_id, ArticleJob.status == JobStatusEnum.FAILED)
+        .values(status=JobStatusEnum.PENDING, error=None, completed_at=None)
+        .returning(ArticleJob.topic, ArticleJob.target_word_count, ArticleJob.language, ArticleJob.created_at)
+    ).first()
+    db.commit()
+    return job
+
+def _fetch_job(job_id: str, include_result: bool):
+    """Load the columns GET /job needs for one job.
+    
+    Selects only status, timestamps and error - never the checkpoint JSON
+    (serp/analysis/outline data) - plus the result only when requested.
+    
+    Returns:
+        Row with those columns, or None if the job doesn't exist
+    """
+    columns = [ArticleJob.status, ArticleJob.created_at, ArticleJob.completed_at, ArticleJob.error]
+    if include_result:
+        columns.append(ArticleJob.result)
+    return SessionScoped().execute(select(*columns).where(ArticleJob.id == job_id)).first()
 
 @app.get("/")
 async def root():
@@ -68,17 +158,15 @@ async def root():
         "status": "running",
         "endpoints": {
             "generate_article": "POST /generate-article",
+            "generate_articles_batch": "POST /generate-articles-batch",
             "check_status": "GET /job/{job_id}",
+            "retry_job": "POST /job/{job_id}/retry",
             "api_docs": "GET /docs"
         }
     }
 
 @app.post("/generate-article", response_model=JobResponse, status_code=202)
-async def generate_article(
-    request: ArticleGenerationRequest,
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
-):
+async def generate_article(request: ArticleGenerationRequest):
     """Generate a new SEO-optimized article (async).
     
     This endpoint immediately returns a job_id and runs the generation in
@@ -95,8 +183,6 @@ async def generate_article(
     
     Args:
         request: Article generation parameters (topic, word count, language)
-        background_tasks: FastAPI's background task queue
-        db: Database session (auto-injected)
     
     Returns:
         JobResponse with job_id, status=pending, and created_at timestamp
@@ -131,41 +217,109 @@ async def generate_article(
     job_id = str(uuid.uuid4())
     
     # Step 2: Create a database record for this job
-    # Status starts as PENDING (not yet started)
-    job = ArticleJob(
-        id=job_id,
-        topic=request.topic,
-        target_word_count=request.target_word_count,
-        language=request.language,
-        status=JobStatusEnum.PENDING,
-        created_at=datetime.utcnow()
-    )
+    # Status starts as PENDING (not yet started). A Core INSERT skips ORM
+    # object construction/unit-of-work; created_at comes from the column
+    # default and RETURNING hands it back in the same round trip (no re-read).
+    row = {
+        "id": job_id,
+        "topic": request.topic,
+        "target_word_count": request.target_word_count,
+        "language": request.language,
+        "status": JobStatusEnum.PENDING
+    }
     
-    # Step 3: Save to database immediately
+    # Step 3: Save to database immediately (off the event loop)
     # This ensures the job exists before we start background processing
-    db.add(job)
-    db.commit()
+    [created_at] = await run_in_threadpool(_insert_jobs, [row])
     
     # Log the request for monitoring/debugging
-    print(f"\n📝 New article generation request:")
-    print(f"   Job ID: {job_id}")
-    print(f"   Topic: {request.topic}")
-    print(f"   Target: {request.target_word_count} words")
+    logger.info(
+        "\n📝 New article generation request:\n   Job ID: %s\n   Topic: %s\n   Target: %d words",
+        job_id, request.topic, request.target_word_count
+    )
     
-    # Step 4: Queue the actual generation work in the background
-    # This runs in a separate thread/process so we can return immediately
-    background_tasks.add_task(run_generation, job_id, request)
+    # Step 4: Queue the actual generation work for the worker pool
+    # The job stays PENDING until a worker picks it up; we return immediately
+    await job_queue.start()  # No-op once running (starts lazily without lifespan events)
+    job_queue.enqueue(job_id, request)
     
     # Step 5: Return the job info to the client
     # They'll use the job_id to poll for results
     return JobResponse(
         job_id=job_id,
-        status=JobStatus.PENDING,
-        created_at=job.created_at
+        status=PENDING,
+        created_at=created_at
     )
 
+# Upper bound on jobs accepted by one batch submission
+MAX_BATCH_SIZE = 50
+
+@app.post("/generate-articles-batch", response_model=List[JobResponse], status_code=202)
+async def generate_articles_batch(requests: List[ArticleGenerationRequest]):
+    """Generate several SEO-optimized articles in one request (async).
+    
+    Works like POST /generate-article for each item: every article gets its
+    own job_id and is polled via GET /job/{job_id}. All job rows are written
+    with a single executemany INSERT (SQLAlchemy's insertmanyvalues batching)
+    and one commit, instead of one round trip per job.
+    
+    Args:
+        requests: List of article generation parameters (1 to MAX_BATCH_SIZE items)
+    
+    Returns:
+        One JobResponse per request, in request order, all status=pending
+    
+    Raises:
+        HTTPException: 400 if the batch is empty or larger than MAX_BATCH_SIZE
+    
+    Example Request:
+        ```json
+        [
+            {"topic": "best productivity tools for remote teams", "target_word_count": 1500},
+            {"topic": "how to run async standups", "target_word_count": 1000}
+        ]
+        ```
+    """
+    if not requests or len(requests) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch must contain between 1 and {MAX_BATCH_SIZE} requests"
+        )
+    
+    job_ids = [str(uuid.uuid4()) for _ in requests]
+    rows = [
+        {
+            "id": job_id,
+            "topic": request.topic,
+            "target_word_count": request.target_word_count,
+            "language": request.language,
+            "status": JobStatusEnum.PENDING
+        }
+        for job_id, request in zip(job_ids, requests)
+    ]
+    
+    # One multi-row INSERT for the whole batch
+    created_ats = await run_in_threadpool(_insert_jobs, rows)
+    
+    logger.info("\n📝 New batch generation request: %d articles", len(requests))
+    
+    await job_queue.start()
+    for job_id, request in zip(job_ids, requests):
+        job_queue.enqueue(job_id, request)
+    
+    return [
+        JobResponse(job_id=job_id, status=PENDING, created_at=created_at)
+        for job_id, created_at in zip(job_ids, created_ats)
+    ]
+
+# Serialized GET /job bodies of completed jobs, keyed by (job_id, include_result).
+# Completed jobs never change, so repeat polls skip the database and the
+# (large) result serialization entirely. Failed jobs aren't cached: a retry
+# puts them back to pending.
+_completed_job_responses = TTLCache(maxsize=1024, ttl=3600)
+
 @app.get("/job/{job_id}", response_model=JobResponse)
-async def get_job_status(job_id: str, db: Session = Depends(get_db)):
+async def get_job_status(job_id: str, include_result: bool = True):
     """Check the status and result of an article generation job.
     
     Clients should poll this endpoint every 5-10 seconds to check
@@ -174,7 +328,9 @@ async def get_job_status(job_id: str, db: Session = Depends(get_db)):
     
     Args:
         job_id: The UUID returned from POST /generate-article
-        db: Database session (auto-injected)
+        include_result: Return the article once completed (default). Pollers
+                        that only watch the status can pass
+                        ?include_result=false to skip the large result payload
     
     Returns:
         JobResponse with current status and result (if completed)
@@ -205,8 +361,13 @@ async def get_job_status(job_id: str, db: Session = Depends(get_db)):
         ```
     """
     
-    # Query the database for this job
-    job = db.query(ArticleJob).filter(ArticleJob.id == job_id).first()
+    cache_key = (job_id, include_result)
+    cached_body = _completed_job_responses.get(cache_key)
+    if cached_body is not None:
+        return Response(content=cached_body, media_type="application/json")
+    
+    # Column projection, loaded (and the result decompressed/parsed) off the event loop
+    job = await run_in_threadpool(_fetch_job, job_id, include_result)
     
     # Return 404 if job doesn't exist
     if not job:
@@ -214,14 +375,60 @@ async def get_job_status(job_id: str, db: Session = Depends(get_db)):
     
     # Return the job status and result
     # Note: job.result is already parsed from JSON by SQLAlchemy
-    return JobResponse(
-        job_id=job.id,
-        status=JobStatus(job.status.value),  # Convert DB enum to API enum
+    response = JobResponse(
+        job_id=job_id,
+        status=job.status.value,  # DB enum → API status string
         created_at=job.created_at,
         completed_at=job.completed_at,
-        result=job.result,  # Full ArticleOutput when completed
+        result=job.result if include_result else None,  # Full ArticleOutput when completed
         error=job.error  # Error message if failed
     )
+    
+    if job.status is JobStatusEnum.COMPLETED:
+        body = response.model_dump_json().encode()
+        _completed_job_responses.set(cache_key, body)
+        return Response(content=body, media_type="application/json")
+    return response
+
+@app.post("/job/{job_id}/retry", response_model=JobResponse, status_code=202)
+async def retry_job(job_id: str):
+    """Re-run a failed generation job (async).
+    
+    The job goes back to pending and is queued like a new one, under the
+    same job_id. The pipeline resumes from the job's saved checkpoints
+    (SERP results, analysis, outline) when they were written by the current
+    pipeline version, so only the failed steps are redone.
+    
+    Args:
+        job_id: The UUID of a job whose status is 'failed'
+    
+    Returns:
+        JobResponse with status=pending
+    
+    Raises:
+        404: If job_id doesn't exist in database
+        409: If the job isn't in the failed state
+    """
+    job = await run_in_threadpool(_requeue_failed_job, job_id)
+    if job is None:
+        if await run_in_threadpool(_fetch_job, job_id, False) is None:
+            raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+        raise HTTPException(status_code=409, detail=f"Only failed jobs can be retried: {job_id}")
+    
+    request = ArticleGenerationRequest(
+        topic=job.topic,
+        target_word_count=job.target_word_count,
+        language=job.language
+    )
+    logger.info("\n🔁 Retrying job %s: %s", job_id, request.topic)
+    
+    await job_queue.start()
+    job_queue.enqueue(job_id, request)
+    
+    return JobResponse(job_id=job_id, status=PENDING, created_at=job.created_at)
+
+# Constant part of the /health body; only the timestamp is formatted per call
+_HEALTH_BODY_PREFIX = b'{"status":"healthy","timestamp":"'
 
 @app.get("/health")
 async def health_check():
@@ -247,15 +454,15 @@ async def health_check():
         - Uptime monitoring (UptimeRobot, Pingdom, etc.)
         - Quick API availability tests before making real requests
     """
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat()
-    }
+    # Probes hit this constantly: splice the timestamp into a prebuilt body
+    # instead of running a dict through FastAPI's JSON encoder
+    timestamp = datetime.now(timezone.utc).isoformat().encode()
+    return Response(content=_HEALTH_BODY_PREFIX + timestamp + b'"}', media_type="application/json")
 
 async def run_generation(job_id: str, request: ArticleGenerationRequest):
     """Background task that executes the full article generation pipeline.
     
-    This function runs asynchronously in the background (via BackgroundTasks),
+    This function runs asynchronously in the background (via the JobQueue workers),
     allowing the API to return a 202 Accepted response immediately while
     the actual generation happens separately.
     
@@ -291,6 +498,10 @@ async def run_generation(job_id: str, request: ArticleGenerationRequest):
         - Mock mode: ~15-30 seconds (no real API calls)
         - Real mode: ~3-5 minutes (depends on Claude API response time)
     """
+    # Imported on first use: the agent stack (Anthropic SDK, prompts) is most of
+    # the app's import time and memory, and isn't needed to serve polls/health
+    from app.agents.orchestrator import ArticleGenerationOrchestrator
+    
     try:
         # Create the orchestrator for this specific job
         orchestrator = ArticleGenerationOrchestrator(job_id)
@@ -302,9 +513,13 @@ async def run_generation(job_id: str, request: ArticleGenerationRequest):
     except Exception as e:
         # This catch-all is a safety net - the orchestrator should handle
         # most errors internally. If we get here, something unexpected happened.
-        print(f"\n❌ Critical background error for job {job_id}: {e}\n")
+        logger.error("\n❌ Critical background error for job %s: %s\n", job_id, e)
         # The orchestrator already saved the error to DB, so just log it
 
+# Generation workers - at most GENERATION_WORKERS pipelines run at once;
+# further jobs wait in the queue as PENDING
+job_queue = JobQueue(get_settings().generation_workers, run_generation)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
@@ -4,7 +4,7 @@ This module defines the input structures that clients send to the API.
 Pydantic handles automatic validation, ensuring all inputs meet our requirements.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 
 class ArticleGenerationRequest(BaseModel):
@@ -12,7 +12,23 @@ class ArticleGenerationRequest(BaseModel):
     
     This is the main input to the system - just give us a topic and we'll
     handle the rest (SERP research, outline, writing, optimization).
+    
+    Frozen: the validated request is handed to the generation queue and
+    read for minutes by the pipeline, so it must not change underneath it.
     """
+    model_config = ConfigDict(
+        frozen=True,
+        str_strip_whitespace=True,  # "  remote work  " → "remote work"
+        # Example request shown in API docs (/docs)
+        json_schema_extra={
+            "example": {
+                "topic": "best productivity tools for remote teams",
+                "target_word_count": 1500,
+                "language": "en"
+            }
+        }
+    )
+    
     # The topic or primary keyword to write about
     # Example: "best productivity tools for remote teams"
     topic: str = Field(
@@ -38,16 +54,6 @@ class ArticleGenerationRequest(BaseModel):
         pattern="^[a-z]{2}$",  # Must be exactly 2 lowercase letters
         description="Language code (ISO 639-1 format, e.g., 'en', 'es', 'fr')"
     )
-    
-    class Config:
-        # Example request shown in API docs (/docs)
-        json_schema_extra = {
-            "example": {
-                "topic": "best productivity tools for remote teams",
-                "target_word_count": 1500,
-                "language": "en"
-            }
-        }
 
 class JobStatusRequest(BaseModel):
     """Request to check the status of a generation job.
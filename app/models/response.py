@@ -2,29 +2,63 @@
 
 This module defines all the data structures returned by the API,
 including article content, SEO metadata, and job status information.
-All models use Pydantic for automatic validation and serialization.
+All models use Pydantic for automatic validation and serialization (the
+small internal records are slotted dataclasses that Pydantic validates and
+serializes as nested fields).
 """
 
-from pydantic import BaseModel, HttpUrl
-from typing import List, Optional, Dict
+from pydantic import BaseModel, ConfigDict
+from dataclasses import dataclass
+from typing import List, Literal, Optional, Dict
 from datetime import datetime
-from enum import Enum
+from functools import cached_property
+import sys
+from urllib.parse import urlsplit
+from app.utils.text import first_words
 
-class JobStatus(str, Enum):
-    """Job execution status.
-    
-    Tracks the lifecycle of an article generation job:
-    - PENDING: Job created, waiting to start
-    - RUNNING: Currently generating article
-    - COMPLETED: Successfully finished
-    - FAILED: Encountered an error
+# Every model sets defer_build=True: its validator/serializer is built on
+# first use instead of at import, so processes that never touch a model
+# (e.g. poll-only API workers) don't pay for it. JobResponse is built once
+# at API startup (see app/main.py).
+#
+# The small records created in bulk by our own code (SERP results, links,
+# references, article sections) are slotted, frozen dataclasses instead:
+# no per-instance __dict__ and no validation when the agents construct them.
+# Pydantic still validates them from dicts where it matters (LLM output via
+# TypeAdapter, stored results in JobResponse) and serializes them natively.
+# Their URL fields are checked in __post_init__ (see _checked_url), which
+# Pydantic runs too, so a bad URL is a ValidationError there.
+
+# Job execution status.
+#
+# Tracks the lifecycle of an article generation job:
+# - pending: Job created, waiting to start
+# - running: Currently generating article
+# - completed: Successfully finished
+# - failed: Encountered an error
+#
+# A Literal rather than an Enum: JobResponse is validated and serialized on
+# every poll, and pydantic-core checks a string literal without creating
+# Python enum members.
+JobStatus = Literal["pending", "running", "completed", "failed"]
+
+# Status of a newly submitted job, returned by the submit/retry endpoints.
+# Other statuses come from the stored JobStatusEnum (status.value).
+PENDING: JobStatus = "pending"
+
+def _checked_url(url: str) -> str:
+    """Return url interned, or raise ValueError unless it is an absolute http(s) URL.
+    
+    The same URLs recur across searches, references and cached jobs, so
+    interning keeps one shared string per distinct URL.
     """
-    PENDING = "pending"
-    RUNNING = "running"
-    COMPLETED = "completed"
-    FAILED = "failed"
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise ValueError(f"Expected an absolute http(s) URL, got {url!r}")
+    return sys.intern(url)
 
-class SERPResult(BaseModel):
+@dataclass(slots=True, frozen=True)
+class SERPResult:
     """A single search engine result from the top 10 rankings.
     
     Contains the key information we extract from each search result
@@ -34,6 +68,9 @@ class SERPResult(BaseModel):
     url: str   # Full URL of the ranking page
     title: str # Page title (usually H1)
     snippet: str  # Meta description or preview text shown in results
+    
+    def __post_init__(self):
+        object.__setattr__(self, "url", _checked_url(self.url))
 
 class KeywordAnalysis(BaseModel):
     """Analysis of keyword usage throughout the article.
@@ -41,11 +78,15 @@ class KeywordAnalysis(BaseModel):
     Tracks how well we've optimized for target keywords without
     over-stuffing (which search engines penalize).
     """
+    model_config = ConfigDict(defer_build=True)
+    
     primary_keyword: str  # Main keyword we're targeting (e.g., "productivity tools")
     secondary_keywords: List[str]  # Related keywords to include naturally
     keyword_density: float  # Percentage of content that is the primary keyword (target: 1-2.5%)
+    keyword_counts: Dict[str, int] = {}  # Occurrences of each keyword (primary + secondary)
 
-class InternalLink(BaseModel):
+@dataclass(slots=True, frozen=True)
+class InternalLink:
     """Suggestion for an internal link to another page on the site.
     
     Internal linking helps distribute page authority and keeps users
@@ -55,7 +96,8 @@ class InternalLink(BaseModel):
     suggested_target: str  # URL or topic of the target page
     context: str  # Why this link is relevant and where it should be placed
 
-class ExternalReference(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ExternalReference:
     """Authoritative external source to reference in the article.
     
     Citing reputable sources builds trust and signals to search engines
@@ -65,6 +107,9 @@ class ExternalReference(BaseModel):
     url: str  # Full URL to the source
     context: str  # What this source adds to the article
     placement_suggestion: str  # Where in the article this citation fits best
+    
+    def __post_init__(self):
+        object.__setattr__(self, "url", _checked_url(self.url))
 
 class SEOMetadata(BaseModel):
     """SEO metadata tags that appear in search results.
@@ -72,11 +117,14 @@ class SEOMetadata(BaseModel):
     These are critical for click-through rates - they're what users
     see in Google before deciding whether to visit your page.
     """
+    model_config = ConfigDict(defer_build=True)
+    
     title_tag: str  # Page title (50-60 chars, appears in browser tab and search results)
     meta_description: str  # Preview text (150-160 chars, shown under title in search)
     focus_keyword: str  # Primary keyword this page is optimized for
 
-class ArticleSection(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ArticleSection:
     """A single section of the article (H2 or H3).
     
     Articles are broken into sections for better readability and SEO.
@@ -93,10 +141,22 @@ class ArticleContent(BaseModel):
     Combines the title, all sections, and provides both structured
     access to individual sections and the full markdown text.
     """
+    model_config = ConfigDict(defer_build=True)
+    
     h1: str  # Article title (only one H1 per page for SEO)
     sections: List[ArticleSection]  # All H2 and H3 sections
     full_text: str  # Complete article in markdown format
     word_count: int  # Total word count across all sections
+    
+    @cached_property
+    def first_100_words(self) -> str:
+        """The article's first 100 words, single-space joined.
+        
+        Computed once per article (with a scan that stops at word 100) and
+        reused by every later check, e.g. repeated quality validations.
+        Not a model field, so it isn't serialized.
+        """
+        return first_words(self.full_text, 100)
 
 class ArticleOutput(BaseModel):
     """The complete output from article generation - everything you need.
@@ -104,6 +164,8 @@ class ArticleOutput(BaseModel):
     This is the final package delivered after a successful generation,
     containing the article itself plus all SEO optimization data.
     """
+    model_config = ConfigDict(defer_build=True)
+    
     article: ArticleContent  # The actual article content
     seo_metadata: SEOMetadata  # Title tags and meta descriptions
     keyword_analysis: KeywordAnalysis  # How well we hit keyword targets
@@ -119,6 +181,8 @@ class JobResponse(BaseModel):
     2. Client polls GET /job/{id} to check status
     3. When status=completed, the result field contains the article
     """
+    model_config = ConfigDict(defer_build=True)
+    
     job_id: str  # Unique identifier for this generation job
     status: JobStatus  # Current status (pending, running, completed, failed)
     created_at: datetime  # When the job was submitted
@@ -0,0 +1,97 @@
+"""In-process job queue for article generation.
+
+POST /generate-article only records the job and enqueues it; a fixed pool
+of worker tasks drains the queue. Compared to running each generation as a
+request BackgroundTask, this:
+    - bounds how many 2-5 minute pipelines run at once (GENERATION_WORKERS),
+      so a burst of requests can't starve status polling
+    - keeps generation off the request/response cycle entirely
+    - leaves extra jobs PENDING in the queue until a worker is free
+
+The queue lives in the API process. For multi-process deployments the
+same enqueue()/handler split maps onto an external queue (arq, Celery, RQ).
+
+Usage:
+    queue = JobQueue(worker_count=4, handler=run_generation)
+    await queue.start()                  # On application startup
+    queue.enqueue(job_id, request)       # Per request
+    await queue.stop()                   # On application shutdown
+"""
+
+from typing import Any, Awaitable, Callable, List, Optional
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueue:
+    """FIFO queue of jobs processed by a fixed number of asyncio worker tasks."""
+
+    def __init__(self, worker_count: int, handler: Callable[..., Awaitable[Any]]):
+        """Create a stopped queue.
+
+        Args:
+            worker_count: Maximum number of jobs processed concurrently
+            handler: Coroutine function called with each job's arguments
+        """
+        self.worker_count = max(1, worker_count)
+        self.handler = handler
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def start(self) -> None:
+        """Start the worker tasks on the running event loop (no-op if already running there)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._workers:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"generation-worker-{i}")
+            for i in range(self.worker_count)
+        ]
+
+    async def stop(self) -> None:
+        """Cancel the workers; jobs still queued stay PENDING in the database."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        self._loop = None
+
+    def enqueue(self, *args: Any) -> None:
+        """Queue a job; its arguments are passed to the handler.
+
+        Must be called from the event loop the queue was started on.
+
+        Raises:
+            RuntimeError: If the queue hasn't been started
+        """
+        if self._queue is None:
+            raise RuntimeError("JobQueue is not running - call start() first")
+        self._queue.put_nowait(args)
+
+    async def join(self) -> None:
+        """Wait until every job queued so far has been processed."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs waiting for a free worker."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def _worker(self) -> None:
+        """Process jobs one at a time until cancelled."""
+        while True:
+            args = await self._queue.get()
+            try:
+                await self.handler(*args)
+            except Exception as e:
+                # The handler records failures itself; never let one kill the worker
+                logger.error("\n❌ Job queue worker error: %s\n", e)
+            finally:
+                self._queue.task_done()
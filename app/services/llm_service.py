@@ -18,18 +18,81 @@ Mock Mode Benefits:
     - Generated 16 real articles with mock mode
 
 Usage:
-    llm = LLMService()
+    llm = get_llm_service()
     text = await llm.generate("Write an intro about productivity tools")
     data = await llm.generate_json("Return top 3 tools as JSON array")
 """
 
-from anthropic import Anthropic, APIError
-from typing import Optional, Dict
+from anthropic import AsyncAnthropic, APIError, APIConnectionError, APIStatusError, DefaultAsyncHttpxClient
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Optional, Dict
 from app.config import get_settings
-import json
-import time
+from app.utils import fast_json
+import asyncio
+import httpx
+import logging
+import random
+import re
 import os
 
+logger = logging.getLogger(__name__)
+
+# Appended to JSON requests - LLMs sometimes wrap JSON in markdown otherwise
+_JSON_ONLY_INSTRUCTION = "IMPORTANT: Return ONLY valid JSON. No markdown, no code blocks, just pure JSON."
+
+# HTTP statuses worth retrying: timeouts, conflicts, rate limits, server
+# errors and 529 "overloaded". Other 4xx errors fail the same way again.
+_RETRYABLE_STATUSES = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+_RETRY_BASE_DELAY = 0.5  # Seconds; doubles per attempt
+_RETRY_MAX_DELAY = 8.0   # Cap for computed backoff
+_RETRY_AFTER_CAP = 30.0  # Never wait longer than this, whatever Retry-After says
+
+def _retry_delay(error: Exception, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying a failed API call, or None if it shouldn't be retried.
+    
+    Connection errors/timeouts and the statuses in _RETRYABLE_STATUSES are
+    transient. A Retry-After header (seconds) is honored when present;
+    otherwise the wait is "full jitter" exponential backoff - a random
+    delay up to 0.5s, 1s, 2s, ... (capped at 8s), so concurrent jobs that
+    hit the same rate limit don't all retry in lockstep.
+    
+    Args:
+        error: Exception raised by the Anthropic client
+        attempt: Zero-based number of the attempt that failed
+    """
+    if isinstance(error, APIStatusError):
+        if error.status_code not in _RETRYABLE_STATUSES:
+            return None
+        retry_after = error.response.headers.get("retry-after")
+        try:
+            if retry_after is not None:
+                return min(max(float(retry_after), 0.0), _RETRY_AFTER_CAP)
+        except ValueError:
+            pass  # HTTP-date form - fall back to computed backoff
+    elif not isinstance(error, APIConnectionError):  # Includes APITimeoutError
+        return None
+    return random.uniform(0, min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** attempt))
+
+@lru_cache()
+def get_anthropic_client() -> AsyncAnthropic:
+    """Return the process-wide async Claude client, creating it on first use.
+    
+    Every LLMService (one per agent, several per job) shares this client,
+    so all Claude calls reuse one pool of keep-alive connections instead of
+    paying a fresh TLS handshake per job.
+    """
+    return AsyncAnthropic(
+        api_key=get_settings().anthropic_api_key,
+        # Retries are handled by LLMService (see _retry_delay) so they can be
+        # logged and bounded per call instead of stacking on the SDK's own
+        max_retries=0,
+        http_client=DefaultAsyncHttpxClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            # Fail fast on unreachable hosts; generation itself can take a while
+            timeout=httpx.Timeout(60.0, connect=5.0)
+        )
+    )
+
 class LLMService:
     """Service for LLM interactions using Claude Sonnet 4.
     
@@ -51,21 +114,28 @@ class LLMService:
         settings = get_settings()
         self.mock_mode = settings.mock_llm
         
+        # Running totals of prompt-cache usage reported by the API,
+        # useful for checking that cached prefixes actually hit
+        self.cache_stats = {
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 0
+        }
+        
         if self.mock_mode:
             # Mock mode: No API key needed, instant responses
-            print("🎭 Running in MOCK MODE - using simulated LLM responses")
+            logger.info("🎭 Running in MOCK MODE - using simulated LLM responses")
             self.available = True
         else:
             # Real API mode: Requires valid Anthropic API key
             try:
-                self.client = Anthropic(api_key=settings.anthropic_api_key)
+                self.client = get_anthropic_client()  # Shared connection pool
                 # Model: claude-sonnet-4-20250514 (~$3 per million tokens)
                 # Chosen for balance of speed, quality, and cost
                 self.model = "claude-sonnet-4-20250514"
                 self.available = True
             except Exception as e:
-                print(f"⚠️  Warning: Anthropic API key not configured. LLM service unavailable.")
-                print(f"   Error: {e}")
+                logger.warning("⚠️  Warning: Anthropic API key not configured. LLM service unavailable.")
+                logger.warning("   Error: %s", e)
                 self.available = False
     
     async def generate(
@@ -73,7 +143,10 @@ class LLMService:
         prompt: str, 
         system_prompt: str = "You are an expert SEO content writer who creates engaging, human-like content.",
         temperature: float = 0.7,
-        max_tokens: int = 4096
+        max_tokens: int = 4096,
+        cache_system: bool = False,
+        cached_prefix: Optional[str] = None,
+        max_retries: int = 3
     ) -> str:
         """Generate free-form text content using Claude (or mock response).
         
@@ -86,13 +159,25 @@ class LLMService:
             temperature: Randomness (0.0 = deterministic, 1.0 = creative). 
                         0.7 balances consistency with natural variation
             max_tokens: Maximum response length (4096 = ~3000 words)
+            cache_system: Mark the system prompt as a prompt-cache breakpoint.
+                        Sonnet only caches prefixes of at least 1024 tokens;
+                        below that the breakpoint is ignored and the call is
+                        billed as regular input (no cache reads or writes)
+            cached_prefix: Static instructions sent BEFORE the prompt as a
+                        separate block of the user message carrying a cache
+                        breakpoint (implies cache_system). Subject to the same
+                        1024-token minimum - the current agent prefixes are
+                        shorter, so they are not cached today; keeping dynamic
+                        values out of them only matters once they grow past it
+            max_retries: Attempts for transient API errors (rate limits, 5xx,
+                        timeouts), with jittered exponential backoff between them
         
         Returns:
             Generated text as a string
         
         Raises:
             Exception: If LLM service not available (missing API key)
-            APIError: If Claude API returns an error
+            APIError: If Claude API returns a non-retryable error, or retries run out
         
         Cost (Real Mode):
             ~$0.003 per generation at 1000 tokens output
@@ -106,36 +191,54 @@ class LLMService:
         # Mock mode: Return pre-written content instantly (no API call)
         # This allows full system testing without API costs
         if self.mock_mode:
-            return self._generate_mock_response(prompt)
+            return self._generate_mock_response(self._join_prefix(cached_prefix, prompt))
         
         # Real API mode: Call Claude Sonnet 4
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                system=system_prompt,  # Shapes Claude's personality/expertise
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
+            system = self._build_system(
+                system_prompt, cache_system or cached_prefix is not None
             )
             
+            for attempt in range(max_retries):
+                try:
+                    response = await self.client.messages.create(
+                        model=self.model,
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                        system=system,  # Shapes Claude's personality/expertise
+                        messages=[
+                            {"role": "user", "content": self._build_user_content(prompt, cached_prefix)}
+                        ]
+                    )
+                    break
+                except APIError as e:
+                    delay = _retry_delay(e, attempt)
+                    if delay is None or attempt == max_retries - 1:
+                        raise
+                    logger.warning("⏳ Transient API error (%s), retrying in %.1fs...", e.__class__.__name__, delay)
+                    await asyncio.sleep(delay)
+            
+            self._record_cache_usage(response.usage)
+            
             # Extract text from response (Claude returns structured format)
             return response.content[0].text
             
         except APIError as e:
-            print(f"❌ Anthropic API Error: {e}")
+            logger.warning("❌ Anthropic API Error: %s", e)
             raise
         except Exception as e:
-            print(f"❌ LLM Error: {e}")
+            logger.warning("❌ LLM Error: %s", e)
             raise
     
     async def generate_json(
         self, 
         prompt: str, 
         system_prompt: str = "You are a helpful assistant that outputs valid JSON.",
-        max_retries: int = 3
-    ) -> Dict:
+        max_retries: int = 3,
+        cache_system: bool = False,
+        cached_prefix: Optional[str] = None,
+        validate: Optional[Callable[[Any], Any]] = None
+    ) -> Any:
         """Generate structured JSON output with automatic retry on parse errors.
         
         LLMs sometimes return markdown code blocks or invalid JSON even when
@@ -149,12 +252,22 @@ class LLMService:
             prompt: Request for structured data (e.g., "Return outline as JSON")
             system_prompt: Role definition (default: JSON-focused assistant)
             max_retries: Number of retry attempts on JSON parse errors
+            cache_system: Serve the system prompt from Anthropic's prompt cache
+                        (only takes effect once the prefix reaches the model's
+                        minimum cacheable length; shorter prompts are sent as usual)
+            cached_prefix: Static instructions/JSON schema sent before the prompt
+                        as a prompt-cache breakpoint (see generate())
+            validate: Optional schema check applied to the parsed JSON (e.g., a
+                        pydantic TypeAdapter's validate_python); its return value
+                        is returned instead. A ValueError from it (pydantic's
+                        ValidationError is one) is retried like a parse error
         
         Returns:
-            Parsed dictionary/list from JSON response
+            Parsed dictionary/list from JSON response (or validate's result)
         
         Raises:
             json.JSONDecodeError: If all retry attempts fail to produce valid JSON
+            ValueError: If all retry attempts fail validation
             Exception: If LLM service unavailable or API error
         
         Used For:
@@ -169,11 +282,18 @@ class LLMService:
         
         # Mock mode - return simulated JSON
         if self.mock_mode:
-            return self._generate_mock_json(prompt)
+            data = self._generate_mock_json(self._join_prefix(cached_prefix, prompt))
+            return validate(data) if validate else data
         
         # Enhance prompt with explicit JSON-only instruction
-        # Even with system prompt, LLMs sometimes add markdown formatting
-        enhanced_prompt = f"{prompt}\n\nIMPORTANT: Return ONLY valid JSON. No markdown, no code blocks, just pure JSON."
+        # Even with system prompt, LLMs sometimes add markdown formatting.
+        # With a cached prefix the (static) instruction joins the prefix, so
+        # the part after the cache breakpoint stays purely dynamic
+        if cached_prefix is not None:
+            cached_prefix = f"{cached_prefix}\n\n{_JSON_ONLY_INSTRUCTION}"
+            enhanced_prompt = prompt
+        else:
+            enhanced_prompt = f"{prompt}\n\n{_JSON_ONLY_INSTRUCTION}"
         
         # Retry loop: Try up to 3 times to get valid JSON
         for attempt in range(max_retries):
@@ -182,72 +302,229 @@ class LLMService:
                 response = await self.generate(
                     enhanced_prompt,
                     system_prompt=system_prompt,
-                    temperature=0.7
+                    temperature=0.7,
+                    cache_system=cache_system,
+                    cached_prefix=cached_prefix
                 )
                 
-                # Clean response - remove markdown code blocks if present
-                # Claude sometimes returns: ```json\n{...}\n```
-                # We need to extract just the {...} part
-                cleaned = response.strip()
-                if cleaned.startswith("```json"):
-                    cleaned = cleaned[7:]  # Remove "```json"
-                if cleaned.startswith("```"):
-                    cleaned = cleaned[3:]   # Remove "```"
-                if cleaned.endswith("```"):
-                    cleaned = cleaned[:-3]  # Remove trailing "```"
-                cleaned = cleaned.strip()
-                
                 # Parse JSON - this will raise JSONDecodeError if invalid
-                return json.loads(cleaned)
+                data = self.parse_json(response)
+                # Check the shape - a malformed response is worth another try,
+                # unlike falling back to canned content downstream
+                return validate(data) if validate else data
                 
-            except json.JSONDecodeError as e:
-                # JSON parsing failed - retry if we have attempts remaining
+            except ValueError as e:
+                # JSON parsing (JSONDecodeError) or validation failed - retry
+                # if we have attempts remaining
                 if attempt < max_retries - 1:
-                    print(f"⚠️  JSON parse error (attempt {attempt + 1}/{max_retries}): {e}")
-                    print(f"   Response preview: {response[:200]}...")
-                    time.sleep(1)  # Brief pause before retry
+                    logger.warning("⚠️  JSON parse/validation error (attempt %d/%d): %s", attempt + 1, max_retries, e)
+                    logger.debug("   Response preview: %s...", response[:200])
+                    await asyncio.sleep(1)  # Brief pause before retry
                 else:
                     # All retries exhausted - fail with detailed error
-                    print(f"❌ Failed to parse JSON after {max_retries} attempts")
-                    print(f"   Last response: {response[:500]}")
+                    logger.warning("❌ Failed to parse JSON after %d attempts", max_retries)
+                    logger.debug("   Last response: %s", response[:500])
                     raise
             except Exception as e:
-                print(f"❌ Error generating JSON: {e}")
+                logger.warning("❌ Error generating JSON: %s", e)
                 raise
     
+    @staticmethod
+    def strip_code_fences(response: str) -> str:
+        """Remove markdown code fences around a JSON response, if present.
+        
+        Claude sometimes returns: ```json\n{...}\n```
+        We need to extract just the {...} part
+        """
+        cleaned = response.strip()
+        if cleaned.startswith("```json"):
+            cleaned = cleaned[7:]  # Remove "```json"
+        if cleaned.startswith("```"):
+            cleaned = cleaned[3:]   # Remove "```"
+        if cleaned.endswith("```"):
+            cleaned = cleaned[:-3]  # Remove trailing "```"
+        return cleaned.strip()
+    
+    @staticmethod
+    def parse_json(response: str):
+        """Parse a (possibly code-fenced) JSON response from the model.
+        
+        Uses orjson when available, otherwise the stdlib json module.
+        
+        Raises:
+            json.JSONDecodeError: If the response isn't valid JSON
+        """
+        return fast_json.loads(LLMService.strip_code_fences(response))
+    
     async def generate_with_retry(
         self,
         prompt: str,
         system_prompt: str = "You are an expert SEO content writer.",
         max_retries: int = 3,
         temperature: float = 0.7,
-        max_tokens: int = 4096
+        max_tokens: int = 4096,
+        cache_system: bool = False
     ) -> str:
         """Generate with exponential backoff retry logic.
         
+        Transient errors (rate limits, 5xx, timeouts) are retried with
+        jittered exponential backoff, honoring Retry-After; other errors
+        are raised immediately.
+        
         Args:
             prompt: User's request/instruction
             system_prompt: Claude's role definition
-            max_retries: Number of retry attempts on failure
+            max_retries: Number of attempts before giving up
             temperature: Randomness (0.0-1.0)
             max_tokens: Maximum response length (4096 default, 8000 for long articles)
+            cache_system: Serve the system prompt from Anthropic's prompt cache
         
         Returns:
             Generated text
         """
+        return await self.generate(
+            prompt, system_prompt, temperature, max_tokens, cache_system,
+            max_retries=max_retries
+        )
+    
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: str = "You are an expert SEO content writer who creates engaging, human-like content.",
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        cache_system: bool = False
+    ) -> AsyncIterator[str]:
+        """Stream generated text as it arrives (or mock response in chunks).
+        
+        Same arguments as generate(), but yields text deltas instead of
+        returning the complete response, so callers can start processing
+        the beginning of a long response while the rest is still generating.
+        
+        Yields:
+            Text chunks in generation order; joined they equal generate()'s output
+        """
+        
+        if not self.available:
+            raise Exception("LLM service not available. Please add ANTHROPIC_API_KEY to .env file.")
+        
+        if self.mock_mode:
+            # Yield the mock response paragraph by paragraph to mimic streaming
+            for chunk in re.split(r'(?<=\n\n)', self._generate_mock_response(prompt)):
+                if chunk:
+                    yield chunk
+            return
+        
+        try:
+            system = self._build_system(system_prompt, cache_system)
+            
+            async with self.client.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                system=system,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ]
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                self._record_cache_usage((await stream.get_final_message()).usage)
+            
+        except APIError as e:
+            logger.warning("❌ Anthropic API Error: %s", e)
+            raise
+        except Exception as e:
+            logger.warning("❌ LLM Error: %s", e)
+            raise
+    
+    async def generate_with_retry_stream(
+        self,
+        prompt: str,
+        system_prompt: str = "You are an expert SEO content writer.",
+        max_retries: int = 3,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        cache_system: bool = False
+    ) -> AsyncIterator[str]:
+        """Streaming counterpart of generate_with_retry().
+        
+        Transient errors are retried with jittered exponential backoff, but
+        only before the first chunk has been yielded - once text has reached
+        the caller a retry would duplicate it, so later errors are re-raised.
+        
+        Yields:
+            Text chunks in generation order
+        """
         
         for attempt in range(max_retries):
+            started = False
             try:
-                return await self.generate(prompt, system_prompt, temperature, max_tokens)
+                async for chunk in self.generate_stream(
+                    prompt, system_prompt, temperature, max_tokens, cache_system
+                ):
+                    started = True
+                    yield chunk
+                return
             except APIError as e:
-                if "rate_limit" in str(e).lower() and attempt < max_retries - 1:
-                    wait_time = 2 ** attempt  # Exponential backoff
-                    print(f"⏳ Rate limited, waiting {wait_time}s before retry...")
-                    time.sleep(wait_time)
-                else:
+                delay = None if started else _retry_delay(e, attempt)
+                if delay is None or attempt == max_retries - 1:
                     raise
+                logger.warning("⏳ Transient API error (%s), retrying in %.1fs...", e.__class__.__name__, delay)
+                await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _build_system(system_prompt: str, cache_system: bool):
+        """Build the `system` argument for a Messages call.
+        
+        With cache_system, the static system prompt is sent as a block with a
+        cache breakpoint. The API only caches it (and everything before it)
+        when that prefix is at least 1024 tokens on Sonnet; shorter prefixes
+        are processed as regular input. Prompt caching is generally available,
+        so no beta header is sent.
+        """
+        if not cache_system:
+            return system_prompt
+        return [{
+            "type": "text",
+            "text": system_prompt,
+            "cache_control": {"type": "ephemeral"}
+        }]
+    
+    @staticmethod
+    def _build_user_content(prompt: str, cached_prefix: Optional[str]):
+        """Build the user message content, with an optional cached static prefix.
+        
+        The prefix goes first as its own block carrying a cache breakpoint.
+        Once system prompt + prefix reach the 1024-token minimum they are
+        served from the prompt cache and only the dynamic prompt after it is
+        processed fresh; below the minimum nothing is cached.
+        """
+        if cached_prefix is None:
+            return prompt
+        return [
+            {"type": "text", "text": cached_prefix, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": prompt}
+        ]
+    
+    @staticmethod
+    def _join_prefix(cached_prefix: Optional[str], prompt: str) -> str:
+        """Single-string form of prefix + prompt (what mock mode matches on)."""
+        return prompt if cached_prefix is None else f"{cached_prefix}\n\n{prompt}"
+    
+    def _record_cache_usage(self, usage) -> None:
+        """Accumulate and log prompt-cache token counts from an API response.
         
-        raise Exception("Max retries exceeded")
+        Anthropic reports cache writes (first call with a new prefix) and
+        cache reads (warm hits) separately from regular input tokens.
+        """
+        created = getattr(usage, "cache_creation_input_tokens", None) or 0
+        read = getattr(usage, "cache_read_input_tokens", None) or 0
+        if not created and not read:
+            return
+        self.cache_stats["cache_creation_input_tokens"] += created
+        self.cache_stats["cache_read_input_tokens"] += read
+        logger.debug("   🗄️  Prompt cache: %d tokens read, %d tokens written", read, created)
     
     def _generate_mock_response(self, prompt: str) -> str:
         """Generate realistic mock text responses for development/testing.
@@ -521,4 +798,13 @@ As you move forward with selecting and implementing the best productivity tools
         return {
             "status": "success",
             "data": "Mock response generated successfully"
-        }
\ No newline at end of file
+        }
+
+@lru_cache()
+def get_llm_service() -> LLMService:
+    """Process-wide LLMService instance shared by all agents and orchestrators.
+    
+    Avoids re-reading settings (and re-announcing mock mode) per job;
+    cache_stats therefore accumulate across the whole process.
+    """
+    return LLMService()
@@ -0,0 +1,213 @@
+"""Semantic cache for reusing pipeline work across near-duplicate topics.
+
+Many requested topics are near-duplicates of earlier ones ("Remote Work Tools"
+vs "tools for remote work"). Steps 1-3 of the pipeline (SERP fetch, SERP
+analysis, outline) depend almost entirely on the topic, so a near-duplicate
+job can reuse the earlier job's results and skip one SerpAPI credit plus two
+Claude calls.
+
+Similarity Model:
+    - Topics are normalized to a set of tokens: lowercased, punctuation
+      stripped, stopwords removed, simple plural folding ("tools" → "tool")
+    - Question words are not stopwords: "how to X" and "why X" have
+      different search intent and must not share an outline
+    - Two topics match when the Jaccard similarity of their token sets
+      meets the threshold (default 0.85)
+    - Entries are also keyed by a caller-supplied bucket (e.g. the exact
+      word-count target), so a 1500-word request never reuses the outline
+      planned for a 1999-word one
+
+    This is a lexical stand-in for embedding similarity: it catches
+    reordering, casing, stopword and plural variants without pulling in an
+    embedding model. Synonym-level matches ("best" vs "top") are misses.
+
+Lookup Tiers:
+    - Exact: an identical normalized topic is a direct dict lookup
+    - Similar: otherwise the closest entry in the same namespace/bucket wins
+
+Storage:
+    - In-process, bounded (LRU eviction) and time-limited (TTL)
+    - Values are deep-copied on store and on hit, so callers can't mutate
+      cached state
+
+Usage:
+    cache = get_semantic_cache()
+    hit = cache.lookup("pipeline", topic, bucket)
+    if hit is None:
+        ...compute...
+        cache.store("pipeline", topic, bucket, value)
+
+    # Or, for async producers:
+    value = await cache.get_or_compute("internal_links", topic, compute_links)
+"""
+
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, FrozenSet, Hashable, Optional, Tuple
+import copy
+import logging
+import re
+import time
+
+logger = logging.getLogger(__name__)
+
+# Words that carry no topical meaning for matching purposes. Question words
+# ("how", "what", "why") are kept: they change the article's search intent
+_STOPWORDS = frozenset({
+    "a", "an", "the", "and", "or", "for", "of", "to", "in", "on", "with",
+    "is", "are", "your", "you", "my"
+})
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def topic_tokens(text: str) -> FrozenSet[str]:
+    """Normalize a topic into the token set used for similarity matching.
+
+    Args:
+        text: Raw topic text (e.g., "Best Productivity Tools for Remote Teams")
+
+    Returns:
+        Frozen set of normalized tokens (e.g., {"best", "productivity", "tool", "remote", "team"})
+    """
+    tokens = set()
+    for token in _TOKEN_RE.findall(text.lower()):
+        if token in _STOPWORDS:
+            continue
+        # Fold simple plurals so "tools" and "tool" match
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.add(token)
+    return frozenset(tokens)
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard similarity of two token sets (1.0 = identical, 0.0 = disjoint)."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class SemanticCache:
+    """Bounded, TTL'd cache whose lookups match on topic similarity.
+
+    Each entry is stored under (namespace, bucket) plus the topic's token
+    set. A lookup returns the most similar entry in the same namespace and
+    bucket whose similarity meets the threshold.
+    """
+
+    def __init__(self, threshold: float = 0.85, max_entries: int = 256, ttl_seconds: float = 3600.0):
+        """Create an empty cache.
+
+        Args:
+            threshold: Minimum Jaccard similarity for a hit (0-1)
+            max_entries: Maximum number of entries before LRU eviction
+            ttl_seconds: How long an entry stays valid after being stored
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # (namespace, bucket, tokens) -> (stored_at, value), in LRU order
+        self._entries: "OrderedDict[Tuple[str, Hashable, FrozenSet[str]], Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, namespace: str, text: str, bucket: Hashable = None) -> Optional[Any]:
+        """Return a copy of the best matching cached value, or None on a miss.
+
+        Args:
+            namespace: Logical cache partition (e.g., "pipeline")
+            text: Topic text to match
+            bucket: Extra exact-match key (e.g., word-count range)
+
+        Returns:
+            Deep copy of the cached value, or None if no entry is similar enough
+        """
+        tokens = topic_tokens(text)
+        now = time.monotonic()
+        
+        # Exact tier: same normalized topic is a plain dict lookup
+        exact_key = (namespace, bucket, tokens)
+        entry = self._entries.get(exact_key)
+        if entry is not None and now - entry[0] <= self.ttl_seconds:
+            self.hits += 1
+            self._entries.move_to_end(exact_key)
+            return copy.deepcopy(entry[1])
+        
+        # Similarity tier: scan for the closest entry in the same partition
+        best_key, best_score = None, 0.0
+
+        for key, (stored_at, _) in list(self._entries.items()):
+            if now - stored_at > self.ttl_seconds:
+                del self._entries[key]  # Expired
+                continue
+            entry_namespace, entry_bucket, entry_tokens = key
+            if entry_namespace != namespace or entry_bucket != bucket:
+                continue
+            score = jaccard(tokens, entry_tokens)
+            if score > best_score:
+                best_key, best_score = key, score
+
+        if best_key is None or best_score < self.threshold:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(best_key)
+        logger.info(
+            "🧠 Semantic cache hit (%.2f similarity) for '%s' — hit ratio %.0f%%",
+            best_score, text, self.hit_ratio * 100
+        )
+        return copy.deepcopy(self._entries[best_key][1])
+
+    def store(self, namespace: str, text: str, bucket: Hashable, value: Any) -> None:
+        """Cache a value for a topic, evicting the least recently used entry if full.
+
+        Args:
+            namespace: Logical cache partition (e.g., "pipeline")
+            text: Topic text the value was computed for
+            bucket: Extra exact-match key (e.g., word-count range)
+            value: Value to cache (deep-copied)
+        """
+        key = (namespace, bucket, topic_tokens(text))
+        self._entries[key] = (time.monotonic(), copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_compute(
+        self,
+        namespace: str,
+        text: str,
+        compute: Callable[[], Awaitable[Any]],
+        bucket: Hashable = None
+    ) -> Any:
+        """Return a cached value for a similar topic, or compute and cache it.
+        
+        Args:
+            namespace: Logical cache partition (e.g., "internal_links")
+            text: Topic text to match
+            compute: Zero-argument coroutine function producing the value on a
+                miss; if it raises, nothing is cached and the error propagates
+            bucket: Extra exact-match key (e.g., word-count range)
+        
+        Returns:
+            Deep copy of the cached value, or the freshly computed value
+        """
+        value = self.lookup(namespace, text, bucket)
+        if value is None:
+            value = await compute()
+            self.store(namespace, text, bucket, value)
+        return value
+    
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups that were hits (0.0 before any lookup)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@lru_cache()
+def get_semantic_cache() -> SemanticCache:
+    """Process-wide SemanticCache instance shared by all orchestrators."""
+    return SemanticCache()
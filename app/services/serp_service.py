@@ -5,10 +5,37 @@ which we analyze to understand what content is currently ranking well.
 Supports both real SerpAPI integration and mock data for development.
 """
 
-import requests
-from typing import List
+import httpx
+import logging
+from functools import lru_cache
+from typing import List, Optional
 from app.models.response import SERPResult
 from app.config import get_settings
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# One pooled HTTP client per process, so repeated searches reuse
+# keep-alive connections instead of a fresh TLS handshake each time
+_http_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared async HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=20),
+            # SERP APIs can be slow, especially for competitive keywords
+            timeout=httpx.Timeout(30.0, connect=10.0)
+        )
+    return _http_client
+
+async def close_http_client():
+    """Close the shared HTTP client (called on application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 
 class SerpAPIService:
     """Fetches search engine results to understand competitive landscape.
@@ -21,10 +48,16 @@ class SerpAPIService:
         self.settings = get_settings()
         self.api_key = self.settings.serpapi_key
         self.base_url = "https://serpapi.com/search"
+        # Recent real API results keyed by normalized query: repeated topics
+        # within the hour skip the HTTP call (and the SerpAPI credit)
+        self._cache = TTLCache(maxsize=512, ttl=3600)
     
-    def search(self, query: str, num_results: int = 10) -> List[SERPResult]:
+    async def search(self, query: str, num_results: int = 10) -> List[SERPResult]:
         """Fetch the top search results for a query.
         
+        The HTTP request is non-blocking, so other jobs on the same event
+        loop keep progressing while SerpAPI responds.
+        
         Args:
             query: The search term (e.g., "best productivity tools")
             num_results: How many results to fetch (default 10)
@@ -33,6 +66,9 @@ class SerpAPIService:
             List of SERPResult objects with rank, URL, title, snippet
             
         Note:
+            Real results are cached for an hour per normalized query
+            (case/whitespace-insensitive); fallback mock data is not cached.
+            
             Automatically falls back to mock data if:
             - No API key is configured
             - We're in development mode
@@ -42,9 +78,15 @@ class SerpAPIService:
         # Use mock data if no API key or in development
         # This saves API costs during development and testing
         if not self.api_key or self.settings.environment == "development":
-            print(f"📝 Using mock SERP data for query: '{query}'")
+            logger.info("📝 Using mock SERP data for query: '%s'", query)
             return self.get_mock_data(query)
         
+        cache_key = (query.strip().lower(), num_results)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.info("♻️  Using cached SERP results for query: '%s'", query)
+            return list(cached)
+        
         try:
             # Build request parameters for SerpAPI
             params = {
@@ -58,31 +100,35 @@ class SerpAPIService:
             }
             
             # Debug: Confirm we're about to hit the real API
-            print(f"🌐 Calling SerpAPI with query: '{query}' (API Key: {self.api_key[:10]}...)")
+            logger.info("🌐 Calling SerpAPI with query: '%s'", query)
             
-            # Make the API request with 30-second timeout
-            # (SERP APIs can be slow, especially for competitive keywords)
-            response = requests.get(self.base_url, params=params, timeout=30)
+            # Make the API request on the shared client (30-second timeout)
+            response = await get_http_client().get(self.base_url, params=params)
             response.raise_for_status()  # Raise exception for 4xx/5xx status codes
             data = response.json()
             
             # Parse the organic results (not ads, featured snippets, etc.)
             results = []
             for i, item in enumerate(data.get("organic_results", [])[:num_results]):
-                results.append(SERPResult(
-                    rank=i + 1,  # Position in results (1-10)
-                    url=item.get("link", ""),  # Page URL
-                    title=item.get("title", ""),  # Page title
-                    snippet=item.get("snippet", "")  # Meta description/preview
-                ))
+                try:
+                    results.append(SERPResult(
+                        rank=i + 1,  # Position in results (1-10)
+                        url=item.get("link", ""),  # Page URL
+                        title=item.get("title", ""),  # Page title
+                        snippet=item.get("snippet", "")  # Meta description/preview
+                    ))
+                except ValueError as e:
+                    # A result without a usable link is skipped, not fatal
+                    logger.debug("   Skipping SERP result %d: %s", i + 1, e)
             
-            print(f"✅ Fetched {len(results)} real SERP results")
+            logger.info("✅ Fetched %d real SERP results", len(results))
+            self._cache.set(cache_key, tuple(results))
             return results
             
         except Exception as e:
             # If anything goes wrong, fall back to mock data
             # Better to continue with mock data than fail completely
-            print(f"⚠️  SERP API Error: {e}. Falling back to mock data.")
+            logger.warning("⚠️  SERP API Error: %s. Falling back to mock data.", e)
             return self.get_mock_data(query)
     
     def get_mock_data(self, query: str) -> List[SERPResult]:
@@ -98,6 +144,8 @@ class SerpAPIService:
             10 mock SERPResult objects mimicking real search results
         """
         
+        query_title = query.title()  # Title-cased once, reused in every title
+        
         # Create realistic-looking search results
         # These mimic the patterns we see in real SERPs:
         # - Position 1-3: Comprehensive guides
@@ -107,63 +155,68 @@ class SerpAPIService:
             SERPResult(
                 rank=1,
                 url="https://example.com/comprehensive-guide",
-                title=f"The Complete Guide to {query.title()} in 2025",
+                title=f"The Complete Guide to {query_title} in 2025",
                 snippet=f"Discover everything you need to know about {query}. Our comprehensive guide covers best practices, expert tips, and proven strategies that work."
             ),
             SERPResult(
                 rank=2,
                 url="https://techblog.com/best-practices",
-                title=f"15 Best {query.title()} Strategies for Success",
+                title=f"15 Best {query_title} Strategies for Success",
                 snippet=f"Learn the top strategies for {query}. Industry experts share their insights, case studies, and actionable recommendations."
             ),
             SERPResult(
                 rank=3,
                 url="https://industry-leader.com/ultimate-guide",
-                title=f"Ultimate {query.title()} Guide for Beginners",
+                title=f"Ultimate {query_title} Guide for Beginners",
                 snippet=f"Start your journey with {query}. Step-by-step tutorials, tools, and resources to help you get started quickly and effectively."
             ),
             SERPResult(
                 rank=4,
                 url="https://expert-reviews.com/comparison",
-                title=f"Top 10 {query.title()} Tools Compared",
+                title=f"Top 10 {query_title} Tools Compared",
                 snippet=f"We tested and compared the leading {query} solutions. See detailed reviews, pricing, features, and our expert recommendations."
             ),
             SERPResult(
                 rank=5,
                 url="https://business-insider.com/trends",
-                title=f"{query.title()} Trends to Watch in 2025",
+                title=f"{query_title} Trends to Watch in 2025",
                 snippet=f"Stay ahead with the latest {query} trends. Market analysis, expert predictions, and emerging technologies shaping the industry."
             ),
             SERPResult(
                 rank=6,
                 url="https://professional-blog.com/how-to",
-                title=f"How to Implement {query.title()} Successfully",
+                title=f"How to Implement {query_title} Successfully",
                 snippet=f"A practical guide to implementing {query}. Real-world examples, common pitfalls to avoid, and proven implementation strategies."
             ),
             SERPResult(
                 rank=7,
                 url="https://authority-site.com/advanced",
-                title=f"Advanced {query.title()} Techniques",
+                title=f"Advanced {query_title} Techniques",
                 snippet=f"Take your {query} skills to the next level. Advanced techniques, optimization strategies, and expert-level insights."
             ),
             SERPResult(
                 rank=8,
                 url="https://case-studies.com/success-stories",
-                title=f"{query.title()} Success Stories and Case Studies",
+                title=f"{query_title} Success Stories and Case Studies",
                 snippet=f"Learn from real success stories. Companies share how they used {query} to achieve remarkable results and ROI."
             ),
             SERPResult(
                 rank=9,
                 url="https://research-institute.com/report",
-                title=f"2025 {query.title()} Research Report",
+                title=f"2025 {query_title} Research Report",
                 snippet=f"Comprehensive research on {query}. Data-driven insights, statistics, and analysis from leading industry researchers."
             ),
             SERPResult(
                 rank=10,
                 url="https://community-forum.com/discussion",
-                title=f"{query.title()} Community Discussion and Tips",
+                title=f"{query_title} Community Discussion and Tips",
                 snippet=f"Join the discussion about {query}. Community members share tips, answer questions, and provide peer support."
             ),
         ]
         
-        return base_results
\ No newline at end of file
+        return base_results
+
+@lru_cache()
+def get_serp_service() -> SerpAPIService:
+    """Process-wide SerpAPIService instance shared by all orchestrators."""
+    return SerpAPIService()
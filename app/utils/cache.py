@@ -0,0 +1,52 @@
+"""Small in-process caches shared by the services.
+
+Dependency-free stand-ins for cachetools-style caches: bounded (LRU
+eviction) and time-limited (TTL). Not thread-safe; intended for use from
+the event loop.
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+import time
+
+
+class TTLCache:
+    """Exact-key cache whose entries expire after a fixed time.
+
+    The least recently used entry is evicted once maxsize is exceeded.
+    Expired entries are dropped lazily when they are looked up.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 3600.0):
+        """Create an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries before LRU eviction
+            ttl: Seconds an entry stays valid after being stored
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (stored_at, value), in LRU order
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,65 @@
+"""Token-budget-aware article excerpts for LLM prompts.
+
+Several prompts only need a taste of the article (e.g., SEO metadata,
+internal link suggestions). Instead of a fixed character slice, which
+can end mid-word and spends its budget on whatever comes first, the
+selector keeps the opening sentence and fills the rest of the budget
+with the sentences that mention the keyword most densely.
+"""
+
+import re
+
+# Sentence boundaries: whitespace following . ! or ?
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Rough characters-per-token ratio for English prose
+_CHARS_PER_TOKEN = 4
+
+
+def select_excerpt(content: str, max_tokens: int, keyword: str) -> str:
+    """Pick an informative excerpt of the article within a token budget.
+
+    The first sentence is always kept (it usually states the topic). The
+    remaining budget goes to the sentences with the highest keyword
+    density (occurrences per character), ties broken by position.
+    Selected sentences are returned in article order.
+
+    Args:
+        content: Article text
+        max_tokens: Token budget for the excerpt (estimated as 4 chars/token)
+        keyword: Phrase that marks the most relevant sentences (case-insensitive)
+
+    Returns:
+        Excerpt of at most max_tokens * 4 characters, never cut mid-word
+
+    Example:
+        select_excerpt(article.full_text, 60, "productivity tools")
+        → "## Introduction Remote work is here to stay. The right productivity tools ..."
+    """
+    budget = max_tokens * _CHARS_PER_TOKEN
+    sentences = [s for s in _SENTENCE_SPLIT_RE.split(content.strip()) if s]
+    if not sentences:
+        return ""
+
+    first = sentences[0]
+    if len(first) >= budget:
+        # Even the opening sentence is too long - cut it at a word boundary
+        return first[:budget + 1].rsplit(None, 1)[0] if budget else ""
+
+    keyword = keyword.lower()
+
+    def density(i: int) -> float:
+        sentence = sentences[i]
+        return sentence.lower().count(keyword) / len(sentence) if keyword else 0.0
+
+    ranked = sorted(range(1, len(sentences)), key=lambda i: (-density(i), i))
+
+    chosen = [0]
+    used = len(first)
+    for i in ranked:
+        cost = len(sentences[i]) + 1  # Joining space
+        if used + cost <= budget:
+            chosen.append(i)
+            used += cost
+
+    return " ".join(sentences[i] for i in sorted(chosen))
@@ -0,0 +1,33 @@
+"""JSON encoding/decoding with orjson when it is installed.
+
+orjson parses and serializes several times faster than the stdlib json
+module, which matters for large payloads (LLM responses, stored article
+results). It is optional: without it, these helpers fall back to the
+stdlib with the same results.
+"""
+
+from typing import Any, Union
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON text.
+
+    Raises:
+        json.JSONDecodeError: If data isn't valid JSON (orjson's error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value: Any) -> str:
+    """Serialize value to JSON text (non-string dict keys become strings, as with json.dumps)."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value)
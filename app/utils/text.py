@@ -0,0 +1,97 @@
+"""Text utilities shared by the agents.
+
+Small, dependency-free helpers for the text measurements several pipeline
+steps need (word counts, keyword occurrence counts). They scan the text
+once and avoid building intermediate token lists.
+"""
+
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, List, Tuple
+import re
+
+# Whitespace-separated tokens, for counting words without building a list
+_WS_RE = re.compile(r'\S+')
+
+
+def word_count(text: str) -> int:
+    """Count words the way str.split() would, without materializing the token list."""
+    return sum(1 for _ in _WS_RE.finditer(text))
+
+
+def first_words(text: str, n: int) -> str:
+    """Return the first n words joined by single spaces.
+    
+    Same result as ' '.join(text.split()[:n]), but only scans as far as
+    the n-th word instead of splitting the whole text.
+    """
+    return ' '.join(m.group() for m in islice(_WS_RE.finditer(text), n))
+
+
+@lru_cache(maxsize=256)
+def _keyword_scanner(keywords: Tuple[str, ...]) -> Tuple["re.Pattern", Dict[str, List[str]]]:
+    """Compile (once per keyword set) the combined pattern and prefix table.
+    
+    Batches reuse the same keywords across many articles, so the regex and
+    the prefix bookkeeping are built once and shared.
+    
+    Args:
+        keywords: Distinct lowercased keywords, longest first
+    
+    Returns:
+        Tuple of (pattern, prefixes) where prefixes maps each keyword to the
+        keywords (itself included) that also occur wherever it matches
+    """
+    # A shorter keyword only counts inside a longer one if it ends on a
+    # word boundary there ("remote" in "remote work", not "product" in "productivity")
+    prefixes = {
+        kw: [other for other in keywords if re.match(re.escape(other) + r'\b', kw)]
+        for kw in keywords
+    }
+    pattern = re.compile(
+        r"(?=\b(" + "|".join(re.escape(kw) for kw in keywords) + r")\b)",
+        re.IGNORECASE
+    )
+    return pattern, prefixes
+
+
+def count_keywords(text: str, keywords: List[str]) -> Dict[str, int]:
+    """Count case-insensitive, whole-phrase occurrences of several keywords in ONE pass.
+    
+    All keywords are combined into a single alternation inside a lookahead,
+    so the regex engine visits each text position once regardless of how
+    many keywords there are (like an Aho-Corasick automaton). At each
+    position the longest matching keyword wins; every shorter keyword that
+    is a prefix of it also occurs there, so it is credited too. Overlapping
+    occurrences are therefore all counted.
+    
+    Keywords are anchored on word boundaries, matching QualityValidator's
+    counting ("productivity" does not match inside "productivityhub").
+    
+    Args:
+        text: Text to scan (e.g., full article)
+        keywords: Keyword phrases (e.g., ["productivity tools", "remote work"])
+    
+    Returns:
+        Dict mapping each keyword (as given) to its occurrence count
+    
+    Example:
+        count_keywords("Remote work tools help remote workers", ["remote work", "remote work tools"])
+        → {"remote work": 1, "remote work tools": 1}
+    """
+    counts = {kw: 0 for kw in keywords}
+    # Distinct, non-empty keywords; longest first so alternation prefers them
+    unique = tuple(sorted({kw.lower() for kw in keywords if kw}, key=len, reverse=True))
+    if not unique:
+        return counts
+    
+    pattern, prefixes = _keyword_scanner(unique)
+    
+    found = dict.fromkeys(unique, 0)
+    for match in pattern.finditer(text):
+        for kw in prefixes.get(match.group(1).lower(), ()):
+            found[kw] += 1
+    
+    for kw in counts:
+        counts[kw] = found.get(kw.lower(), 0)
+    return counts
@@ -22,7 +22,8 @@ def test_serp_service_returns_results():
     not os.environ.get("RUN_REAL_API", "false").lower() == "true",
     reason="Skipped unless RUN_REAL_API=true environment variable is set"
 )
-def test_serp_service_real_api():
+@pytest.mark.asyncio
+async def test_serp_service_real_api():
     """Test SERP service with real API call (run with: RUN_REAL_API=true pytest)
     
     This test hits the actual SerpAPI and consumes 1 API credit.
@@ -32,7 +33,7 @@ def test_serp_service_real_api():
         RUN_REAL_API=true pytest tests/test_agents.py::test_serp_service_real_api -v
     """
     serp_service = SerpAPIService()
-    results = serp_service.search("productivity tools for remote work")
+    results = await serp_service.search("productivity tools for remote work")
     
     # Real API returns 8-10 results depending on query and Google's results
     assert len(results) >= 8, f"Expected at least 8 results, got {len(results)}"
@@ -44,6 +45,36 @@ def test_serp_service_real_api():
     assert all(r.title for r in results)
     print(f"\n✅ Real API returned {len(results)} results")
 
+@pytest.mark.asyncio
+async def test_serp_api_key_never_logged(monkeypatch, caplog):
+    """Test the SerpAPI key (a URL query parameter) stays out of the logs"""
+    import dataclasses
+    import httpx
+    import logging
+    from app.config import configure_logging
+    from app.services import serp_service
+    
+    secret = "sk_SECRETSERPKEY123456"
+    
+    def respond(request):
+        return httpx.Response(200, json={"organic_results": [
+            {"link": "https://example.com", "title": "Title", "snippet": "Snippet"}
+        ]})
+    
+    configure_logging()
+    monkeypatch.setattr(serp_service, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(respond)))
+    service = SerpAPIService()
+    service.api_key = secret
+    service.settings = dataclasses.replace(service.settings, environment="production")
+    
+    with caplog.at_level(logging.DEBUG):
+        results = await service.search("remote work tools")
+    
+    assert len(results) == 1
+    assert caplog.records  # The search itself was logged
+    assert secret not in caplog.text
+    assert all(secret not in str(record.args) for record in caplog.records)
+
 def test_serp_service_mock_data_structure():
     """Test mock SERP data has correct structure"""
     serp_service = SerpAPIService()
@@ -222,3 +253,427 @@ def test_quality_validator_word_count_accuracy():
     
     word_count_issues = [issue for issue in result["issues"] if "word count" in issue.lower()]
     assert len(word_count_issues) > 0
+
+@pytest.mark.asyncio
+async def test_content_generator_batched_fallback_refires_missing_sections():
+    """Test batched fallback keeps delimited sections and re-requests only missing ones"""
+    from app.agents.content_generator import ContentGenerator, _normalize_sections
+    
+    section_body = " ".join(["productivity"] * 60)
+    
+    class StubLLM:
+        def __init__(self):
+            self.calls = 0
+        
+        async def generate_with_retry(self, prompt, **kwargs):
+            self.calls += 1
+            if "[[BEGIN" in prompt:
+                # Batched call: section 2 is missing from the response
+                return f"[[BEGIN 1]]\n{section_body}\n[[END 1]]"
+            return f"Single section: {section_body}"
+    
+    generator = ContentGenerator()
+    generator.llm_service = StubLLM()
+    sections = _normalize_sections([
+        {"h2": "First", "word_count": 60, "key_points": []},
+        {"h2": "Second", "word_count": 60, "key_points": []},
+    ])
+    
+    article = await generator._generate_article_fallback("Title", sections, "productivity", [])
+    
+    assert generator.llm_service.calls == 2  # one batch + one re-fire for section 2
+    assert [s.heading for s in article.sections] == ["First", "Second"]
+    assert article.sections[0].content == section_body
+    assert article.sections[1].content.startswith("Single section:")
+
+@pytest.mark.asyncio
+async def test_content_generator_streamed_sections_match_full_parse():
+    """Test sections parsed while streaming equal a parse of the finished article"""
+    from app.agents.content_generator import ContentGenerator
+    
+    article = (
+        "# Title\n\n" + "Intro sentence here. " * 40 +
+        "\n\n## First Section\nSome text.\n### A Subsection\nMore text.\n\n"
+        "## Second Section\n" + "word " * 100 + "\n## Third Section\nThe end."
+    )
+    
+    class StubLLM:
+        async def generate_with_retry_stream(self, prompt, **kwargs):
+            # Tiny chunks so headings straddle chunk boundaries
+            for i in range(0, len(article), 3):
+                yield article[i:i + 3]
+    
+    generator = ContentGenerator()
+    generator.llm_service = StubLLM()
+    
+    full_text, sections = await generator._generate_full_article_oneshot("Title", [], "keyword", [], 0)
+    
+    assert full_text == article.strip()
+    assert sections == generator._parse_article_into_sections(full_text, [])
+    assert [s.heading for s in sections] == ["First Section", "Second Section", "Third Section"]
+
+@pytest.mark.asyncio
+async def test_content_generator_caches_identical_requests():
+    """Test identical generate_article calls for one job share one LLM request"""
+    import asyncio
+    from app.agents.content_generator import ContentGenerator
+    
+    article = "# Cached Title\n\n" + "Intro text. " * 60 + "\n\n## Section\nBody text."
+    
+    class StubLLM:
+        def __init__(self):
+            self.calls = 0
+        
+        async def generate_with_retry_stream(self, prompt, **kwargs):
+            self.calls += 1
+            await asyncio.sleep(0)
+            yield article
+    
+    stub = StubLLM()
+    generator = ContentGenerator()
+    generator.llm_service = stub
+    outline = {"h1": "Cached Title", "sections": [{"h2": "Section", "word_count": 100}]}
+    serp_analysis = {"primary_keyword": "cache test keyword", "secondary_keywords": []}
+    
+    first, second = await asyncio.gather(
+        generator.generate_article(outline, serp_analysis, job_id="job-a"),
+        generator.generate_article(outline, serp_analysis, job_id="job-a")
+    )
+    
+    assert stub.calls == 1
+    assert first == second
+    assert first is not second  # Callers get independent copies
+    
+    # Another job with the same outline, or an unscoped call, writes a fresh article
+    await generator.generate_article(outline, serp_analysis, job_id="job-b")
+    await generator.generate_article(outline, serp_analysis)
+    assert stub.calls == 3
+
+@pytest.mark.asyncio
+async def test_outline_generator_caches_outlines():
+    """Test identical outline requests reuse the cached LLM outline"""
+    outline = {"h1": "Outline Cache Title", "sections": [{"h2": "Intro", "word_count": 200}]}
+    
+    class StubLLM:
+        def __init__(self):
+            self.calls = 0
+        
+        async def generate_json(self, prompt, **kwargs):
+            self.calls += 1
+            return outline
+    
+    stub = StubLLM()
+    generator = OutlineGenerator(stub)
+    analysis = {"primary_keyword": "outline cache keyword", "common_topics": ["A", "B"]}
+    
+    first = await generator.generate_outline(analysis, "outline cache topic", 1500)
+    second = await generator.generate_outline(analysis, "outline cache topic", 1500)
+    await generator.generate_outline(analysis, "outline cache topic", 2000)
+    
+    assert stub.calls == 2  # Different target word count is a miss
+    assert first == second == outline
+    assert second is not first  # Hits are copies
+
+@pytest.mark.asyncio
+async def test_seo_generate_all_falls_back_per_call():
+    """Test one failing SEO call falls back without discarding the others"""
+    from app.agents.seo_metadata_generator import SEOMetadataGenerator
+    
+    class StubLLM:
+        async def generate_json(self, prompt, cached_prefix="", validate=None, **kwargs):
+            if "internal links" in cached_prefix:
+                raise RuntimeError("rate limited")
+            if "metadata" in cached_prefix:
+                data = {"title_tag": "Stub Title", "meta_description": "Stub description", "focus_keyword": "stub"}
+            else:
+                data = {"references": [{"source_name": "Stub Source", "url": "https://stub.example.com"}]}
+            return validate(data) if validate else data
+    
+    metadata, links, refs = await SEOMetadataGenerator(StubLLM()).generate_all(
+        "Article text", "Stub H1", "stub topic", "stub"
+    )
+    
+    assert metadata.title_tag == "Stub Title"
+    assert links[0].anchor_text == "stub topic best practices"  # Fallback
+    assert refs[0].source_name == "Stub Source"
+
+@pytest.mark.asyncio
+async def test_seo_malformed_response_is_retried_then_validated():
+    """Test a wrongly shaped LLM response is retried instead of accepted"""
+    from app.agents.seo_metadata_generator import SEOMetadataGenerator
+    
+    class StubLLM:
+        def __init__(self):
+            self.responses = [
+                {"links": "not a list"},
+                {"links": [{"anchor_text": "guide", "suggested_target": "/guide"}]}
+            ]
+        
+        async def generate_json(self, prompt, validate=None, **kwargs):
+            # Same validate-and-retry contract as LLMService.generate_json
+            for data in self.responses:
+                try:
+                    return validate(data)
+                except ValueError:
+                    continue
+            raise ValueError("all attempts invalid")
+    
+    links = await SEOMetadataGenerator(StubLLM()).generate_internal_links("Text.", "validation retry topic")
+    
+    assert len(links) == 1
+    assert links[0].suggested_target == "/guide"
+    assert links[0].context == ""  # Missing field filled with its default
+
+@pytest.mark.asyncio
+async def test_seo_link_cache_is_keyed_by_primary_keyword():
+    """Test cached internal links aren't shared across primary keywords"""
+    from app.agents.seo_metadata_generator import SEOMetadataGenerator
+    
+    class StubLLM:
+        def __init__(self):
+            self.prompts = []
+        
+        async def generate_json(self, prompt, validate=None, **kwargs):
+            self.prompts.append(prompt)
+            return validate({"links": [{"anchor_text": "guide", "suggested_target": f"/guide-{len(self.prompts)}"}]})
+    
+    llm = StubLLM()
+    generator = SEOMetadataGenerator(llm)
+    topic = "keyword keyed link cache topic"
+    
+    first = await generator.generate_internal_links("Text.", topic, "standing desks")
+    again = await generator.generate_internal_links("Text.", topic, "Standing Desks")
+    other = await generator.generate_internal_links("Text.", topic, "ergonomic chairs")
+    
+    assert len(llm.prompts) == 2  # Second call was a cache hit
+    assert again[0].suggested_target == first[0].suggested_target
+    assert other[0].suggested_target != first[0].suggested_target
+    assert 'Primary keyword: "ergonomic chairs"' in llm.prompts[1]
+
+def test_semantic_cache_matches_near_duplicate_topics():
+    """Test semantic cache hits on reordered/plural topic variants only"""
+    from app.services.semantic_cache import SemanticCache
+    
+    cache = SemanticCache()
+    cache.store("pipeline", "Productivity Tools for Remote Teams", 3, {"outline": "cached"})
+    
+    hit = cache.lookup("pipeline", "remote team productivity tool", 3)
+    assert hit == {"outline": "cached"}
+    
+    # Different bucket, namespace or topic are misses
+    assert cache.lookup("pipeline", "remote team productivity tool", 4) is None
+    assert cache.lookup("other", "remote team productivity tool", 3) is None
+    assert cache.lookup("pipeline", "project management software", 3) is None
+    
+    # Hits are copies - mutating one must not change the cache
+    hit["outline"] = "mutated"
+    assert cache.lookup("pipeline", "Productivity Tools for Remote Teams", 3) == {"outline": "cached"}
+
+def test_semantic_cache_keeps_question_words_and_exact_bucket():
+    """Test question words change the match and word-count buckets are exact"""
+    from app.services.semantic_cache import SemanticCache
+    
+    cache = SemanticCache()
+    cache.store("pipeline", "How to learn Python", (1500, "en"), {"outline": "how-to"})
+    
+    # Different search intent ("why" vs "how") is a miss
+    assert cache.lookup("pipeline", "Why learn Python", (1500, "en")) is None
+    # A nearby but different word-count target or language is a miss
+    assert cache.lookup("pipeline", "How to learn Python", (1999, "en")) is None
+    assert cache.lookup("pipeline", "How to learn Python", (1500, "de")) is None
+    assert cache.lookup("pipeline", "how to learn python", (1500, "en")) == {"outline": "how-to"}
+
+@pytest.mark.asyncio
+async def test_semantic_cache_get_or_compute():
+    """Test get_or_compute only calls the producer on a miss and never caches failures"""
+    from app.services.semantic_cache import SemanticCache
+
+    cache = SemanticCache()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return ["link"]
+
+    async def failing():
+        raise RuntimeError("LLM down")
+
+    assert await cache.get_or_compute("links", "remote work tools", compute) == ["link"]
+    assert await cache.get_or_compute("links", "Remote Work Tools", compute) == ["link"]
+    assert len(calls) == 1
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_compute("refs", "remote work tools", failing)
+    assert cache.lookup("refs", "remote work tools") is None
+
+def test_keyword_counts_single_pass():
+    """Test one-pass keyword counting handles case, overlapping keywords and word boundaries"""
+    from app.utils.text import count_keywords
+    
+    text = "Remote work tools help remote workers. REMOTE WORK is here to stay."
+    counts = count_keywords(text, ["remote work", "remote work tools", "stay"])
+    
+    # "remote workers" is not a whole-phrase match for "remote work"
+    assert counts == {"remote work": 2, "remote work tools": 1, "stay": 1}
+    
+    counts = count_keywords("productivityhub boosts productivity", ["productivity", "product"])
+    assert counts == {"productivity": 1, "product": 0}
+
+def test_analyze_keywords_reports_secondary_counts():
+    """Test keyword analysis carries per-keyword counts alongside the density"""
+    from app.agents.seo_metadata_generator import SEOMetadataGenerator
+    
+    text = "Remote work tools help remote teams. Good tools matter for remote work."
+    analysis = SEOMetadataGenerator(object()).analyze_keywords(text, "remote work", ["tools", "remote teams"])
+    
+    assert analysis.keyword_counts == {"remote work": 2, "tools": 2, "remote teams": 1}
+    assert analysis.keyword_density == round(2 / 12 * 100, 2)
+
+def test_select_excerpt_keeps_opening_and_keyword_sentences():
+    """Test excerpts keep the first sentence, prefer keyword sentences and respect the budget"""
+    from app.utils.excerpt import select_excerpt
+    
+    text = (
+        "Remote work changed how teams operate. "
+        "Many offices closed during that period. "
+        "The best productivity tools keep remote teams aligned. "
+        "Weather was mild that year."
+    )
+    excerpt = select_excerpt(text, 25, "productivity tools")
+    
+    assert excerpt == "Remote work changed how teams operate. The best productivity tools keep remote teams aligned."
+    assert len(select_excerpt(text, 5, "productivity tools")) <= 20
+    assert select_excerpt("", 60, "anything") == ""
+
+def test_llm_retry_delay_classifies_errors():
+    """Test only transient API errors are retried and Retry-After is honored"""
+    import httpx
+    from anthropic import APITimeoutError, BadRequestError, RateLimitError
+    from app.services.llm_service import _retry_delay
+    
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+    
+    def status_error(cls, status, headers=None):
+        response = httpx.Response(status, headers=headers or {}, request=request)
+        return cls("error", response=response, body=None)
+    
+    assert _retry_delay(status_error(RateLimitError, 429, {"retry-after": "2"}), 0) == 2.0
+    assert 0 <= _retry_delay(status_error(RateLimitError, 429), 2) <= 2.0
+    assert 0 <= _retry_delay(APITimeoutError(request), 0) <= 0.5
+    assert _retry_delay(status_error(BadRequestError, 400), 0) is None
+
+@pytest.mark.asyncio
+async def test_job_queue_bounds_concurrency():
+    """Test the job queue runs every job but never more than worker_count at once"""
+    import asyncio
+    from app.services.job_queue import JobQueue
+    
+    state = {"running": 0, "max_running": 0, "done": []}
+    
+    async def handler(job_id):
+        state["running"] += 1
+        state["max_running"] = max(state["max_running"], state["running"])
+        await asyncio.sleep(0.01)
+        state["running"] -= 1
+        state["done"].append(job_id)
+    
+    queue = JobQueue(worker_count=2, handler=handler)
+    await queue.start()
+    for i in range(5):
+        queue.enqueue(i)
+    await queue.join()
+    await queue.stop()
+    
+    assert sorted(state["done"]) == [0, 1, 2, 3, 4]
+    assert state["max_running"] == 2
+
+def test_compressed_json_round_trip_and_legacy_rows():
+    """Test compressed JSON columns round-trip and still read uncompressed legacy rows"""
+    from app.database.models import CompressedJSON
+    
+    column_type = CompressedJSON()
+    value = {"article": {"full_text": "remote work " * 200}, "score": 9}
+    
+    stored = column_type.process_bind_param(value, None)
+    assert isinstance(stored, bytes) and len(stored) < len(str(value))
+    assert column_type.process_result_value(stored, None) == value
+    assert column_type.process_result_value('{"legacy": true}', None) == {"legacy": True}
+    assert column_type.process_result_value(None, None) is None
+
+def test_ttl_cache_expires_and_evicts():
+    """Test TTL cache drops expired entries and evicts least recently used"""
+    from app.utils.cache import TTLCache
+    
+    cache = TTLCache(maxsize=2, ttl=3600)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    
+    expired = TTLCache(ttl=0)
+    expired.set("a", 1)
+    assert expired.get("a") is None
+
+def test_result_urls_are_interned():
+    """Test equal URLs share one string, including after JSON validation"""
+    from pydantic import TypeAdapter
+    from typing import List
+    from app.models.response import ExternalReference
+    
+    first = SERPResult(rank=1, url="".join(["https://example.com/", "tools"]), title="T", snippet="S")
+    second = SERPResult(rank=2, url="".join(["https://example.com/", "tools"]), title="T", snippet="S")
+    assert first.url is second.url
+    
+    reference = '{"source_name": "Gartner", "url": "https://www.gartner.com/en", "context": "c", "placement_suggestion": "p"}'
+    refs = TypeAdapter(List[ExternalReference]).validate_json(f"[{reference}, {reference}]")
+    assert refs[0].url is refs[1].url
+
+def test_result_urls_must_be_absolute_http():
+    """Test SERP results and references reject URLs without an http(s) scheme and host"""
+    from pydantic import TypeAdapter, ValidationError
+    from typing import List
+    from app.models.response import ExternalReference, SERPResult
+    
+    for bad_url in ["", "example.com/page", "ftp://example.com/file", "https://"]:
+        with pytest.raises(ValueError):
+            SERPResult(rank=1, url=bad_url, title="T", snippet="S")
+    
+    with pytest.raises(ValidationError):
+        TypeAdapter(List[ExternalReference]).validate_python([
+            {"source_name": "Gartner", "url": "not a url", "context": "c", "placement_suggestion": "p"}
+        ])
+
+def test_upgrade_schema_adds_missing_columns():
+    """Test an article_jobs table from an older version gets the new columns"""
+    from sqlalchemy import create_engine, inspect, text
+    from app.database.models import _upgrade_schema
+    
+    old_engine = create_engine("sqlite://")
+    with old_engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE article_jobs (id VARCHAR PRIMARY KEY, topic VARCHAR NOT NULL, "
+            "target_word_count INTEGER, language VARCHAR, status VARCHAR(9), created_at DATETIME, "
+            "completed_at DATETIME, serp_data JSON, outline_data JSON, result JSON, error TEXT)"
+        ))
+        conn.execute(text("INSERT INTO article_jobs (id, topic) VALUES ('job-1', 'remote work')"))
+    
+    _upgrade_schema(old_engine)
+    _upgrade_schema(old_engine)  # Idempotent
+    
+    columns = {column["name"] for column in inspect(old_engine).get_columns("article_jobs")}
+    assert {"analysis_data", "pipeline_version"} <= columns
+    with old_engine.connect() as conn:
+        row = conn.execute(text("SELECT topic, pipeline_version FROM article_jobs")).one()
+    assert tuple(row) == ("remote work", None)
+
+def test_checkpoint_staging_does_not_wait_on_commits():
+    """Test staging a checkpoint never blocks on the DB session lock"""
+    from app.agents.orchestrator import ArticleGenerationOrchestrator
+    
+    orchestrator = ArticleGenerationOrchestrator("staging-job")
+    # Simulate a commit in progress in a worker thread
+    with orchestrator._db_lock:
+        orchestrator._save_checkpoint("outline_data", {"h1": "Staged"})
+    assert orchestrator._pending == {"outline_data": {"h1": "Staged"}}
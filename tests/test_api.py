@@ -84,6 +84,22 @@ def test_generate_article_validation_short_topic():
     )
     assert response.status_code == 422
 
+def test_generate_articles_batch_rejects_empty_batch():
+    """Test batch endpoint rejects an empty list"""
+    response = client.post("/generate-articles-batch", json=[])
+    assert response.status_code == 400
+
+def test_generate_articles_batch_validates_each_item():
+    """Test batch endpoint validates every request in the list"""
+    response = client.post(
+        "/generate-articles-batch",
+        json=[
+            {"topic": "test productivity tools", "target_word_count": 800},
+            {"topic": "test topic", "target_word_count": 100}  # Below minimum
+        ]
+    )
+    assert response.status_code == 422
+
 def test_get_job_status():
     """Test job status retrieval for existing job"""
     # First create a job
@@ -109,6 +125,12 @@ def test_get_job_status_invalid_id():
     assert "detail" in data
     assert "not found" in data["detail"].lower()
 
+def test_retry_unknown_job_returns_404():
+    """Test retrying a job that doesn't exist returns 404"""
+    with TestClient(app) as started_client:  # Runs startup (creates tables)
+        response = started_client.post("/job/nonexistent-job-id/retry")
+    assert response.status_code == 404
+
 def test_generate_article_default_values():
     """Test article generation with default values"""
     response = client.post(